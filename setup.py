@@ -5,9 +5,14 @@ Installation and distribution configuration for the Python SDK.
 """
 
 from setuptools import setup, find_packages
+import functools
 import os
+import re
+
+_VERSION_RE = re.compile(rb'^__version__\s*=\s*[\'"]([^\'"]+)[\'"]', re.M)
 
 # Read the README file
+@functools.lru_cache(maxsize=1)
 def read_readme():
     readme_path = os.path.join(os.path.dirname(__file__), 'README.md')
     if os.path.exists(readme_path):
@@ -16,13 +21,12 @@ def read_readme():
     return "Zetsubou.life Python SDK"
 
 # Read version from __init__.py
+@functools.lru_cache(maxsize=1)
 def get_version():
     init_path = os.path.join(os.path.dirname(__file__), 'zetsubou', '__init__.py')
-    with open(init_path, 'r', encoding='utf-8') as f:
-        for line in f:
-            if line.startswith('__version__'):
-                return line.split('=')[1].strip().strip('"').strip("'")
-    return "1.0.0"
+    with open(init_path, 'rb') as f:
+        match = _VERSION_RE.search(f.read())
+    return match.group(1).decode() if match else "1.0.0"
 
 setup(
     name="zetsubou-sdk",
@@ -72,6 +76,10 @@ setup(
             "sphinx>=4.0.0",
             "sphinx-rtd-theme>=0.5.0",
         ],
+        "fast": [
+            "orjson>=3.9",
+            "ciso8601>=2.3",
+        ],
         "async": [
             "aiohttp>=3.8.0",
             "asyncio-throttle>=1.0.0",
@@ -0,0 +1,48 @@
+"""Tests for zetsubou.utils JSON encoding."""
+
+import datetime
+import decimal
+import json
+
+import pytest
+
+from zetsubou import utils
+
+PAYLOAD = {
+    'name': 'café \U0001f600',
+    'count': 3,
+    'ratio': 0.25,
+    'enabled': True,
+    'missing': None,
+    'tags': ['a', 'b'],
+    'by_id': {1: 'one', 2: {'nested': [1, 2.5]}},
+    'flags': {True: 'yes', None: 'none', 1.5: 'half'},
+}
+
+
+def _as_str(value):
+    return str(value)
+
+
+@pytest.fixture
+def dumps_orjson():
+    pytest.importorskip('orjson')
+    return utils._dumps_json_orjson
+
+
+def test_stdlib_matches_json_dumps():
+    assert json.loads(utils._dumps_json_stdlib(PAYLOAD)) == json.loads(json.dumps(PAYLOAD))
+
+
+def test_backends_encode_same_payload(dumps_orjson):
+    assert json.loads(dumps_orjson(PAYLOAD)) == json.loads(utils._dumps_json_stdlib(PAYLOAD))
+
+
+def test_backends_apply_default(dumps_orjson):
+    payload = {'price': decimal.Decimal('1.50'), 'items': [decimal.Decimal('2')]}
+    assert json.loads(dumps_orjson(payload, default=_as_str)) == json.loads(utils._dumps_json_stdlib(payload, default=_as_str))
+
+
+def test_orjson_keeps_naive_datetimes_naive(dumps_orjson):
+    value = datetime.datetime(2024, 1, 2, 3, 4, 5)
+    assert json.loads(dumps_orjson({'at': value})) == {'at': '2024-01-02T03:04:05'}
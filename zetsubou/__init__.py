@@ -9,28 +9,15 @@ Example:
     >>> client = ZetsubouClient(api_key="ztb_live_your_key_here")
     >>> tools = client.tools.list()
     >>> job = client.tools.execute("remove_bg", files=["image.jpg"])
+
+Public names are resolved lazily on first access (PEP 562), so importing the
+package does not pull in ``requests`` or the service modules. Set
+``ZETSUBOU_EAGER=1`` to import everything up front instead.
 """
 
-from .client import ZetsubouClient
-from .exceptions import (
-    ZetsubouError,
-    AuthenticationError,
-    RateLimitError,
-    ValidationError,
-    NotFoundError,
-    ServerError,
-    WebhookError
-)
-from .models import (
-    Tool,
-    Job,
-    VFSNode,
-    ChatConversation,
-    ChatMessage,
-    Webhook,
-    Account,
-    StorageQuota
-)
+import importlib
+import os
+from typing import TYPE_CHECKING
 
 __version__ = "1.3.0"
 __author__ = "Zetsubou.life"
@@ -38,6 +25,7 @@ __email__ = "support@zetsubou.life"
 
 __all__ = [
     "ZetsubouClient",
+    "AsyncZetsubouClient",
     "ZetsubouError",
     "AuthenticationError", 
     "RateLimitError",
@@ -53,4 +41,68 @@ __all__ = [
     "Webhook",
     "Account",
     "StorageQuota"
-]
\ No newline at end of file
+]
+
+# Maps each public name to the module that defines it
+_LAZY = {
+    "ZetsubouClient": "zetsubou.client",
+    "AsyncZetsubouClient": "zetsubou.async_client",  # needs the "async" extra
+    "ZetsubouError": "zetsubou.exceptions",
+    "AuthenticationError": "zetsubou.exceptions",
+    "RateLimitError": "zetsubou.exceptions",
+    "ValidationError": "zetsubou.exceptions",
+    "NotFoundError": "zetsubou.exceptions",
+    "ServerError": "zetsubou.exceptions",
+    "WebhookError": "zetsubou.exceptions",
+    "Tool": "zetsubou.models",
+    "Job": "zetsubou.models",
+    "VFSNode": "zetsubou.models",
+    "ChatConversation": "zetsubou.models",
+    "ChatMessage": "zetsubou.models",
+    "Webhook": "zetsubou.models",
+    "Account": "zetsubou.models",
+    "StorageQuota": "zetsubou.models",
+}
+
+if TYPE_CHECKING:
+    from .client import ZetsubouClient
+    from .async_client import AsyncZetsubouClient
+    from .exceptions import (
+        ZetsubouError,
+        AuthenticationError,
+        RateLimitError,
+        ValidationError,
+        NotFoundError,
+        ServerError,
+        WebhookError
+    )
+    from .models import (
+        Tool,
+        Job,
+        VFSNode,
+        ChatConversation,
+        ChatMessage,
+        Webhook,
+        Account,
+        StorageQuota
+    )
+
+
+def __getattr__(name):
+    try:
+        module_name = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + list(_LAZY))
+
+
+if os.environ.get("ZETSUBOU_EAGER") == "1":
+    for _name in _LAZY:
+        __getattr__(_name)
+    del _name
@@ -0,0 +1,98 @@
+"""
+Zetsubou.life SDK Error Mapping
+
+Translates HTTP error responses into SDK exceptions. Shared by the sync and
+async clients so both raise identical errors for identical responses.
+"""
+
+import math
+from typing import Any, Dict, Mapping, NoReturn, Optional
+
+from .exceptions import (
+    ZetsubouError,
+    AuthenticationError,
+    RateLimitError,
+    ValidationError,
+    NotFoundError,
+    ServerError
+)
+from .utils import loads_json
+
+# Non-retryable error statuses -> (exception class, fallback message)
+STATUS_TO_EXC = {
+    400: (ValidationError, 'Validation error'),
+    401: (AuthenticationError, 'Authentication failed'),
+    404: (NotFoundError, 'Resource not found'),
+}
+RATE_LIMIT = 429
+
+# Longest Retry-After (seconds) waited out automatically on a 429; longer
+# waits are raised to the caller as RateLimitError
+MAX_RETRY_AFTER = 30
+
+# Server errors retried with backoff before an error is raised
+RETRY_STATUSES = (500, 502, 503, 504)
+
+# Statuses a server without an optional endpoint (e.g. a batch route) may
+# answer with: not found, method not allowed (the path matched another
+# route) and not implemented
+UNSUPPORTED_STATUSES = (404, 405, 501)
+
+
+def retry_after_seconds(headers: Mapping[str, str]) -> Optional[float]:
+    """Return a numeric ``Retry-After`` header in seconds, or None."""
+    value = headers.get('Retry-After')
+    if value is None:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        # HTTP-date form; the API sends delay-seconds
+        return None
+
+
+def parse_error_body(body: bytes, status_code: int) -> Dict[str, Any]:
+    """Parse an error response body, falling back to a synthetic payload."""
+    try:
+        return loads_json(body)
+    except (ValueError, KeyError):
+        return {
+            'message': body.decode('utf-8', 'replace') or f'HTTP {status_code}',
+            'code': f'HTTP_{status_code}',
+            'status_code': status_code
+        }
+
+
+def _error_for_status(status_code: int, error_data: Dict[str, Any], headers: Mapping[str, str]) -> ZetsubouError:
+    exc_info = STATUS_TO_EXC.get(status_code)
+    if exc_info is not None:
+        exc_cls, default_message = exc_info
+        return exc_cls(error_data.get('message', default_message), error_data)
+    if status_code == RATE_LIMIT:
+        retry_after = retry_after_seconds(headers)
+        retry_after = 60 if retry_after is None else math.ceil(retry_after)
+        return RateLimitError(
+            error_data.get('message', 'Rate limit exceeded'),
+            error_data,
+            retry_after=retry_after
+        )
+    if 500 <= status_code < 600:
+        return ServerError(error_data.get('message', 'Server error'), error_data)
+    return ZetsubouError(
+        f"Unexpected status code {status_code}: {error_data.get('message', 'Unknown error')}",
+        error_data
+    )
+
+
+def raise_for_status(status_code: int, error_data: Dict[str, Any], headers: Mapping[str, str]) -> NoReturn:
+    """Raise the SDK exception matching a non-2xx status code."""
+    exc = _error_for_status(status_code, error_data, headers)
+    if exc.status_code is None:
+        # JSON error bodies rarely repeat the status
+        exc.status_code = status_code
+    raise exc
+
+
+def is_unsupported(exc: ZetsubouError) -> bool:
+    """Return True if ``exc`` means the server lacks the requested endpoint."""
+    return exc.status_code in UNSUPPORTED_STATUSES
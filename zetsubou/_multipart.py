@@ -0,0 +1,182 @@
+"""
+Zetsubou.life SDK Multipart Encoding
+
+Streaming ``multipart/form-data`` request bodies for file uploads.
+"""
+
+import binascii
+import io
+import os
+from typing import Any, Dict, List, Optional, Tuple
+
+
+def _quote(value: str) -> str:
+    """Escape a header parameter value the way browsers (and urllib3) do."""
+    return value.translate({10: '%0A', 13: '%0D', 34: '%22'})
+
+
+def _guess_filename(fileobj) -> Optional[str]:
+    name = getattr(fileobj, 'name', None)
+    if isinstance(name, str) and name and name[0] != '<' and name[-1] != '>':
+        return os.path.basename(name)
+    return None
+
+
+def _file_extent(fileobj) -> Optional[Tuple[int, int]]:
+    """Return (start offset, remaining size) of a seekable file, or None."""
+    try:
+        start = fileobj.tell()
+        try:
+            end = os.fstat(fileobj.fileno()).st_size
+        except (AttributeError, OSError, io.UnsupportedOperation):
+            end = fileobj.seek(0, os.SEEK_END)
+            fileobj.seek(start)
+    except (AttributeError, OSError, io.UnsupportedOperation):
+        return None
+    return start, max(end - start, 0)
+
+
+class MultipartBody:
+    """
+    File-like ``multipart/form-data`` body that reads files as it is sent.
+    
+    Accepts the same ``data``/``files`` arguments as ``requests`` but, unlike
+    ``requests``' encoder, never loads file contents into memory: the body is
+    assembled from the part headers and the open files on each ``read()``.
+    Its length is known up front (``Content-Length``, no chunked encoding)
+    and it can be rewound with ``seek()``, so urllib3 retries resend the
+    whole body. File-likes that cannot report their size are read into
+    memory as a fallback.
+    
+    Args:
+        data: Form fields (name -> value, or an iterable of values sent as
+            repeated fields; ``None`` values are skipped)
+        files: Files (name -> file object, or a ``(filename, content[,
+            content_type[, headers]])`` tuple with a file object, bytes or
+            str content)
+    """
+    
+    def __init__(self, data: Optional[Dict[str, Any]], files: Dict[str, Any]):
+        self.boundary = binascii.hexlify(os.urandom(16)).decode('ascii')
+        self.content_type = f'multipart/form-data; boundary={self.boundary}'
+        
+        # (source, start, size): source is bytes or a file object
+        self._segments: List[Tuple[Any, int, int]] = []
+        for name, value in (data or {}).items():
+            # Like requests: iterables become one part per item and None
+            # values are left out
+            if isinstance(value, (str, bytes)) or not hasattr(value, '__iter__'):
+                value = [value]
+            for item in value:
+                if item is None:
+                    continue
+                if not isinstance(item, bytes):
+                    item = str(item).encode('utf-8')
+                self._add(self._part_header(name))
+                self._add(item)
+                self._add(b'\r\n')
+        for name, spec in files.items():
+            content_type = headers = None
+            if isinstance(spec, (tuple, list)):
+                filename, content = spec[0], spec[1]
+                if len(spec) > 2:
+                    content_type = spec[2]
+                if len(spec) > 3:
+                    headers = spec[3]
+            else:
+                filename, content = _guess_filename(spec) or name, spec
+            self._add(self._part_header(name, filename, content_type, headers))
+            self._add(content)
+            self._add(b'\r\n')
+        self._add(f'--{self.boundary}--\r\n'.encode('ascii'))
+        
+        self._length = sum(size for _, _, size in self._segments)
+        self._pos = 0
+        self._index = 0
+        self._offset = 0
+    
+    def _part_header(
+        self,
+        name: str,
+        filename: Optional[str] = None,
+        content_type: Optional[str] = None,
+        headers: Optional[Dict[str, str]] = None
+    ) -> bytes:
+        lines = [f'--{self.boundary}', f'Content-Disposition: form-data; name="{_quote(name)}"']
+        if filename is not None:
+            lines[1] += f'; filename="{_quote(filename)}"'
+        if content_type:
+            lines.append(f'Content-Type: {content_type}')
+        for key, value in (headers or {}).items():
+            lines.append(f'{key}: {value}')
+        lines.append('\r\n')
+        return '\r\n'.join(lines).encode('utf-8')
+    
+    def _add(self, content):
+        if isinstance(content, str):
+            content = content.encode('utf-8')
+        if isinstance(content, (bytes, bytearray)):
+            if self._segments and isinstance(self._segments[-1][0], bytes):
+                # Merge adjacent literal segments
+                previous = self._segments.pop()[0]
+                content = previous + content
+            self._segments.append((bytes(content), 0, len(content)))
+            return
+        
+        extent = _file_extent(content)
+        if extent is None:
+            # Unsized stream: buffer it
+            self._add(content.read())
+            return
+        self._segments.append((content, extent[0], extent[1]))
+    
+    def __len__(self) -> int:
+        return self._length
+    
+    def tell(self) -> int:
+        return self._pos
+    
+    def seek(self, pos: int, whence: int = os.SEEK_SET) -> int:
+        if whence == os.SEEK_CUR:
+            pos += self._pos
+        elif whence == os.SEEK_END:
+            pos += self._length
+        pos = min(max(pos, 0), self._length)
+        
+        self._pos = pos
+        self._index = 0
+        for source, start, size in self._segments:
+            if pos < size:
+                break
+            pos -= size
+            self._index += 1
+        self._offset = pos
+        if self._index < len(self._segments):
+            source, start, _ = self._segments[self._index]
+            if not isinstance(source, bytes):
+                source.seek(start + pos)
+        return self._pos
+    
+    def read(self, size: int = -1) -> bytes:
+        if size is None or size < 0:
+            size = self._length - self._pos
+        chunks = []
+        while size > 0 and self._index < len(self._segments):
+            source, start, seg_size = self._segments[self._index]
+            if self._offset == 0 and not isinstance(source, bytes):
+                source.seek(start)
+            n = min(size, seg_size - self._offset)
+            if isinstance(source, bytes):
+                chunk = source[self._offset:self._offset + n]
+            else:
+                chunk = source.read(n)
+                if len(chunk) != n:
+                    raise IOError('Upload file changed size while being sent')
+            chunks.append(chunk)
+            size -= n
+            self._pos += n
+            self._offset += n
+            if self._offset == seg_size:
+                self._index += 1
+                self._offset = 0
+        return b''.join(chunks)
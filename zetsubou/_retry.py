@@ -0,0 +1,36 @@
+"""
+Zetsubou.life SDK Retry Policy
+
+urllib3 retry policy mounted on the sync client's HTTP adapter.
+"""
+
+from urllib3.exceptions import MaxRetryError
+from urllib3.util.retry import Retry
+
+from ._errors import MAX_RETRY_AFTER, RATE_LIMIT
+
+
+class RetryPolicy(Retry):
+    """
+    urllib3 ``Retry`` that only waits out short rate limits.
+    
+    429 responses are retried after the server's ``Retry-After`` delay (or
+    the usual backoff without one), but a delay longer than
+    ``MAX_RETRY_AFTER`` seconds ends retrying at once, so the call raises
+    :class:`~zetsubou.exceptions.RateLimitError` instead of blocking.
+    """
+    
+    def parse_retry_after(self, retry_after: str) -> float:
+        # urllib3 only accepts whole seconds or an HTTP-date
+        try:
+            return max(float(retry_after), 0.0)
+        except ValueError:
+            return super().parse_retry_after(retry_after)
+    
+    def increment(self, method=None, url=None, response=None, error=None, _pool=None, _stacktrace=None):
+        if response is not None and response.status == RATE_LIMIT:
+            retry_after = self.get_retry_after(response)
+            if retry_after is not None and retry_after > MAX_RETRY_AFTER:
+                # With raise_on_status=False the 429 response is returned
+                raise MaxRetryError(_pool, url, 'Retry-After exceeds MAX_RETRY_AFTER')
+        return super().increment(method, url, response, error, _pool, _stacktrace)
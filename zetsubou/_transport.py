@@ -0,0 +1,43 @@
+"""
+Zetsubou.life SDK Transport
+
+requests HTTP adapter mounted on the sync client's session.
+"""
+
+import socket
+
+import urllib3
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection
+
+# Block size used when sending file-like request bodies (uploads); urllib3's
+# default of 16 KiB costs one Python-level read per block
+SEND_BLOCK_SIZE = 1024 * 1024
+
+# urllib3's defaults (TCP_NODELAY) plus TCP keep-alive, so pooled connections
+# idling between calls and long event streams notice dead peers. Socket buffer
+# sizes are left to the kernel: a fixed SO_RCVBUF/SO_SNDBUF disables TCP
+# autotuning and is capped by net.core.rmem_max/wmem_max anyway
+SOCKET_OPTIONS = HTTPConnection.default_socket_options + [
+    (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1),
+]
+
+# ``blocksize`` is a urllib3 2.x pool key; 1.26 pool managers reject it
+_SUPPORTS_BLOCKSIZE = int(urllib3.__version__.split('.')[0]) >= 2
+
+
+class TransportAdapter(HTTPAdapter):
+    """
+    ``HTTPAdapter`` tuned for the SDK's connections.
+    
+    Streamed uploads (:class:`~zetsubou._multipart.MultipartBody`, open
+    files) are read and written to the socket ``SEND_BLOCK_SIZE`` bytes at
+    a time instead of 16 KiB (urllib3 2.x only), cutting per-block overhead
+    on large uploads, and sockets are opened with ``SOCKET_OPTIONS``.
+    """
+    
+    def init_poolmanager(self, *args, **pool_kwargs):
+        if _SUPPORTS_BLOCKSIZE:
+            pool_kwargs.setdefault('blocksize', SEND_BLOCK_SIZE)
+        pool_kwargs.setdefault('socket_options', SOCKET_OPTIONS)
+        super().init_poolmanager(*args, **pool_kwargs)
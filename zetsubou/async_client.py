@@ -0,0 +1,328 @@
+"""
+Zetsubou.life Async API Client
+
+asyncio client built on aiohttp, for callers that want to run many API
+operations (e.g. job polling) concurrently on a single thread.
+
+Requires the ``async`` extra: ``pip install "zetsubou-sdk[async]"``.
+"""
+
+import asyncio
+import importlib
+import io
+import os
+from typing import TYPE_CHECKING, Optional, Dict, Any, List, Tuple
+
+from ._errors import MAX_RETRY_AFTER, RATE_LIMIT, RETRY_STATUSES, parse_error_body, raise_for_status, retry_after_seconds
+from .client import _USER_AGENT
+from .exceptions import ZetsubouError, ConnectionError as APIConnectionError, TimeoutError as APITimeoutError
+from .utils import loads_json, parse_json
+
+if TYPE_CHECKING:
+    import aiohttp
+    from .services.jobs import AsyncJobsService
+    from .services.vfs import AsyncVFSService
+    from .services.webhooks import AsyncWebhooksService
+
+
+def _file_positions(files: Optional[Dict[str, Any]]) -> Optional[List[Tuple[Any, int]]]:
+    """
+    Return (file object, offset) for every file in ``files``.
+    
+    A retried request rewinds its files to these offsets, since the previous
+    attempt left them at EOF. Returns None if any file cannot be rewound, in
+    which case the request is not retried.
+    """
+    positions = []
+    for value in (files or {}).values():
+        content = value[1] if isinstance(value, tuple) else value
+        if isinstance(content, (bytes, bytearray, str)):
+            continue
+        try:
+            positions.append((content, content.tell()))
+        except (AttributeError, OSError, io.UnsupportedOperation):
+            return None
+    return positions
+
+
+class _FileView(io.RawIOBase):
+    """
+    Upload file handed to aiohttp for one attempt.
+    
+    aiohttp closes file payloads once they are sent; closing this view
+    leaves the caller's file open, so a retry can rewind and resend it.
+    """
+    
+    def __init__(self, fileobj):
+        super().__init__()
+        self._file = fileobj
+        self.name = getattr(fileobj, 'name', None)
+    
+    def readable(self) -> bool:
+        return True
+    
+    def readinto(self, buffer) -> int:
+        data = self._file.read(len(buffer))
+        buffer[:len(data)] = data
+        return len(data)
+    
+    def read(self, size: int = -1) -> bytes:
+        return self._file.read(size)
+    
+    def seekable(self) -> bool:
+        return True
+    
+    def seek(self, offset: int, whence: int = os.SEEK_SET) -> int:
+        return self._file.seek(offset, whence)
+    
+    def tell(self) -> int:
+        return self._file.tell()
+    
+    def fileno(self) -> int:
+        return self._file.fileno()
+
+
+class AsyncResponse:
+    """
+    Fully read HTTP response returned by :class:`AsyncZetsubouClient`.
+    
+    Exposes the subset of the ``requests.Response`` interface used by the SDK
+    (``status_code``, ``headers``, ``content``, ``text``, ``json()``), so the
+    same parsing helpers work for sync and async responses.
+    """
+    
+    __slots__ = ('status_code', 'headers', 'content', 'url')
+    
+    def __init__(self, status_code: int, headers, content: bytes, url: str):
+        self.status_code = status_code
+        self.headers = headers
+        self.content = content
+        self.url = url
+    
+    @property
+    def text(self) -> str:
+        return self.content.decode('utf-8', 'replace')
+    
+    def json(self) -> Any:
+        return loads_json(self.content)
+
+
+class AsyncZetsubouClient:
+    """
+    Async client for interacting with the Zetsubou.life API v2.
+    
+    Mirrors :class:`~zetsubou.ZetsubouClient`, but every request method is a
+    coroutine. Use it as an async context manager so the underlying aiohttp
+    session is closed::
+        
+        async with AsyncZetsubouClient(api_key="ztb_live_...") as client:
+            health = await client.health_check()
+    
+    Args:
+        api_key: Your API key (starts with 'ztb_live_')
+        base_url: API base URL (default: https://zetsubou.life)
+        timeout: Request timeout in seconds (default: 30)
+        retry_attempts: Number of retry attempts for failed requests (default: 3)
+    
+    Async services (``jobs``, ``vfs``, ``webhooks``) are imported and
+    instantiated on first access and cached on the instance afterwards.
+    """
+    
+    # Attribute name -> (module, class) for lazily constructed services
+    _SERVICE_MAP = {
+        'jobs': ('zetsubou.services.jobs', 'AsyncJobsService'),
+        'vfs': ('zetsubou.services.vfs', 'AsyncVFSService'),
+        'webhooks': ('zetsubou.services.webhooks', 'AsyncWebhooksService'),
+    }
+    
+    if TYPE_CHECKING:
+        jobs: AsyncJobsService
+        vfs: AsyncVFSService
+        webhooks: AsyncWebhooksService
+    
+    def __init__(
+        self,
+        api_key: str,
+        base_url: str = "https://zetsubou.life",
+        timeout: int = 30,
+        retry_attempts: int = 3
+    ):
+        try:
+            import aiohttp
+        except ImportError:
+            raise ImportError(
+                'AsyncZetsubouClient requires aiohttp; install it with pip install "zetsubou-sdk[async]"'
+            ) from None
+        
+        self._aiohttp = aiohttp
+        self.api_key = api_key
+        self.base_url = base_url.rstrip('/')
+        self.timeout = timeout
+        self.retry_attempts = retry_attempts
+        
+        # aiohttp sessions must be created inside a running event loop, so the
+        # session is built on the first request
+        self._session = None
+    
+    def __getattr__(self, name: str):
+        # Only called on attribute misses, so cached services resolve normally
+        spec = type(self)._SERVICE_MAP.get(name)
+        if spec is None:
+            raise AttributeError(f"{type(self).__name__!r} object has no attribute {name!r}")
+        module = importlib.import_module(spec[0])
+        service = getattr(module, spec[1])(self)
+        object.__setattr__(self, name, service)
+        return service
+    
+    @property
+    def session(self) -> 'aiohttp.ClientSession':
+        """aiohttp session with default headers, created on first access."""
+        if self._session is None or self._session.closed:
+            aiohttp = self._aiohttp
+            self._session = aiohttp.ClientSession(
+                headers={
+                    'X-API-Key': self.api_key,
+                    'User-Agent': _USER_AGENT,
+                },
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+                connector=aiohttp.TCPConnector(limit=20)
+            )
+        return self._session
+    
+    def _build_form(self, data: Optional[Dict[str, Any]], files: Dict[str, Any]) -> 'aiohttp.FormData':
+        """Convert requests-style ``data``/``files`` arguments into a multipart form."""
+        form = self._aiohttp.FormData()
+        for key, value in (data or {}).items():
+            form.add_field(key, str(value))
+        for key, value in files.items():
+            content_type = None
+            if isinstance(value, tuple):
+                filename, content = value[0], value[1]
+                content_type = value[2] if len(value) > 2 else None
+            else:
+                name = getattr(value, 'name', None)
+                filename = os.path.basename(name) if isinstance(name, str) and name else key
+                content = value
+            if not isinstance(content, (bytes, bytearray, str)):
+                content = _FileView(content)
+            form.add_field(key, content, filename=filename, content_type=content_type)
+        return form
+    
+    async def _make_request(
+        self,
+        method: str,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        data: Optional[Dict[str, Any]] = None,
+        files: Optional[Dict[str, Any]] = None
+    ) -> AsyncResponse:
+        """
+        Make an HTTP request to the API with retry logic and error handling.
+        
+        Connection errors, timeouts and 5xx responses are retried with
+        exponential backoff (``asyncio.sleep``, so other tasks keep running);
+        429 responses are retried after their ``Retry-After`` delay when it
+        is at most ``MAX_RETRY_AFTER`` seconds. Uploaded files are rewound
+        before each retry; requests with unseekable files are not retried.
+        
+        Args:
+            method: HTTP method (GET, POST, PUT, DELETE, PATCH)
+            endpoint: API endpoint (e.g., '/api/v2/tools')
+            params: Query parameters
+            data: Request body data
+            files: Files to upload (for multipart requests)
+        
+        Returns:
+            AsyncResponse holding the fully read body
+        
+        Raises:
+            ZetsubouError: For various API errors
+        """
+        aiohttp = self._aiohttp
+        
+        if endpoint.startswith('/'):
+            url = self.base_url + endpoint
+        else:
+            url = self.base_url + '/' + endpoint
+        
+        positions = _file_positions(files)
+        retry_attempts = self.retry_attempts if positions is not None else 0
+        
+        for attempt in range(retry_attempts + 1):
+            if attempt and positions:
+                for fileobj, offset in positions:
+                    fileobj.seek(offset)
+            try:
+                async with self.session.request(
+                    method,
+                    url,
+                    params=params,
+                    json=data if not files else None,
+                    data=self._build_form(data, files) if files else None
+                ) as response:
+                    body = await response.read()
+            except (asyncio.TimeoutError, aiohttp.ClientConnectionError) as e:
+                if attempt < retry_attempts:
+                    await asyncio.sleep(0.5 * 2 ** attempt)
+                    continue
+                exc_cls = APITimeoutError if isinstance(e, asyncio.TimeoutError) else APIConnectionError
+                raise exc_cls(f"Request failed after {retry_attempts} retries: {str(e)}")
+            except aiohttp.ClientError as e:
+                raise ZetsubouError(f"Unexpected error: {str(e)}")
+            
+            status = response.status
+            if 200 <= status < 300:
+                return AsyncResponse(status, response.headers, body, str(response.url))
+            if status in RETRY_STATUSES and attempt < retry_attempts:
+                await asyncio.sleep(0.5 * 2 ** attempt)
+                continue
+            if status == RATE_LIMIT and attempt < retry_attempts:
+                retry_after = retry_after_seconds(response.headers)
+                if retry_after is None:
+                    retry_after = 0.5 * 2 ** attempt
+                if retry_after <= MAX_RETRY_AFTER:
+                    await asyncio.sleep(retry_after)
+                    continue
+            raise_for_status(status, parse_error_body(body, status), response.headers)
+    
+    async def get(self, endpoint: str, params: Optional[Dict[str, Any]] = None) -> AsyncResponse:
+        """Make a GET request."""
+        return await self._make_request('GET', endpoint, params=params)
+    
+    async def post(self, endpoint: str, data: Optional[Dict[str, Any]] = None, files: Optional[Dict[str, Any]] = None) -> AsyncResponse:
+        """Make a POST request."""
+        return await self._make_request('POST', endpoint, data=data, files=files)
+    
+    async def put(self, endpoint: str, data: Optional[Dict[str, Any]] = None) -> AsyncResponse:
+        """Make a PUT request."""
+        return await self._make_request('PUT', endpoint, data=data)
+    
+    async def patch(self, endpoint: str, data: Optional[Dict[str, Any]] = None) -> AsyncResponse:
+        """Make a PATCH request."""
+        return await self._make_request('PATCH', endpoint, data=data)
+    
+    async def delete(self, endpoint: str) -> AsyncResponse:
+        """Make a DELETE request."""
+        return await self._make_request('DELETE', endpoint)
+    
+    async def health_check(self) -> Dict[str, Any]:
+        """
+        Check API health status.
+        
+        Returns:
+            Health status information
+        """
+        response = await self.get('/health')
+        return parse_json(response)
+    
+    async def close(self):
+        """Close the HTTP session."""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+    
+    async def __aenter__(self):
+        return self
+    
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
@@ -5,8 +5,8 @@ Zetsubou.life CLI Tool
 Command-line interface for the Zetsubou.life SDK.
 """
 
-import argparse
 import json
+import os
 import sys
 from pathlib import Path
 from typing import List, Optional
@@ -14,6 +14,15 @@ from typing import List, Optional
 from .client import ZetsubouClient
 from .exceptions import ZetsubouError
 
+_JOB_STATUS_ICON = {
+    'completed': '✅',
+    'failed': '❌',
+    'running': '🔄',
+    'pending': '⏳',
+    'cancelled': '⏹️'
+}
+_TOOL_STATUS_ICON = ('❌', '✅')  # indexed by tool.accessible
+
 
 def list_tools(client: ZetsubouClient, category: Optional[str] = None):
     """List available tools."""
@@ -22,19 +31,17 @@ def list_tools(client: ZetsubouClient, category: Optional[str] = None):
     if category:
         tools = [t for t in tools if t.category == category]
     
-    print(f"\nAvailable Tools ({len(tools)}):")
-    print("=" * 50)
-    
+    lines = [f"\nAvailable Tools ({len(tools)}):", "=" * 50]
     for tool in tools:
-        status = "✅" if tool.accessible else "❌"
-        print(f"{status} {tool.name}")
-        print(f"   ID: {tool.id}")
-        print(f"   Category: {tool.category}")
-        print(f"   Tier: {tool.required_tier}")
-        print(f"   Input: {tool.input_type} → Output: {tool.output_type}")
+        lines.append(f"{_TOOL_STATUS_ICON[bool(tool.accessible)]} {tool.name}")
+        lines.append(f"   ID: {tool.id}")
+        lines.append(f"   Category: {tool.category}")
+        lines.append(f"   Tier: {tool.required_tier}")
+        lines.append(f"   Input: {tool.input_type} → Output: {tool.output_type}")
         if tool.description:
-            print(f"   Description: {tool.description}")
-        print()
+            lines.append(f"   Description: {tool.description}")
+        lines.append("")
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 def execute_tool(
@@ -85,26 +92,17 @@ def list_jobs(client: ZetsubouClient, status: Optional[str] = None, limit: int =
     """List jobs."""
     jobs = client.jobs.list(status=status, limit=limit)
     
-    print(f"\nRecent Jobs ({len(jobs)}):")
-    print("=" * 50)
-    
+    lines = [f"\nRecent Jobs ({len(jobs)}):", "=" * 50]
     for job in jobs:
-        status_icon = {
-            'completed': '✅',
-            'failed': '❌',
-            'running': '🔄',
-            'pending': '⏳',
-            'cancelled': '⏹️'
-        }.get(job.status, '❓')
-        
-        print(f"{status_icon} {job.id}")
-        print(f"   Tool: {job.tool_id}")
-        print(f"   Status: {job.status}")
-        print(f"   Progress: {job.progress}%")
-        print(f"   Created: {job.created_at}")
+        lines.append(f"{_JOB_STATUS_ICON.get(job.status, '❓')} {job.id}")
+        lines.append(f"   Tool: {job.tool_id}")
+        lines.append(f"   Status: {job.status}")
+        lines.append(f"   Progress: {job.progress}%")
+        lines.append(f"   Created: {job.created_at}")
         if job.error:
-            print(f"   Error: {job.error}")
-        print()
+            lines.append(f"   Error: {job.error}")
+        lines.append("")
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 def get_job(client: ZetsubouClient, job_id: str):
@@ -144,17 +142,16 @@ def list_files(client: ZetsubouClient, limit: int = 20):
     """List VFS files."""
     files = client.vfs.list_nodes(node_type="file", limit=limit)
     
-    print(f"\nVFS Files ({len(files)}):")
-    print("=" * 50)
-    
+    lines = [f"\nVFS Files ({len(files)}):", "=" * 50]
     for file in files:
         size_mb = file.size_bytes / (1024 * 1024)
-        print(f"📄 {file.name}")
-        print(f"   ID: {file.id}")
-        print(f"   Size: {size_mb:.2f} MB")
-        print(f"   Type: {file.mime_type}")
-        print(f"   Created: {file.created_at}")
-        print()
+        lines.append(f"📄 {file.name}")
+        lines.append(f"   ID: {file.id}")
+        lines.append(f"   Size: {size_mb:.2f} MB")
+        lines.append(f"   Type: {file.mime_type}")
+        lines.append(f"   Created: {file.created_at}")
+        lines.append("")
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 def account_info(client: ZetsubouClient):
@@ -189,12 +186,22 @@ def account_info(client: ZetsubouClient):
         sys.exit(1)
 
 
-def main():
-    """Main CLI function."""
-    parser = argparse.ArgumentParser(
-        description="Zetsubou.life CLI Tool",
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
+_HELP = """usage: zetsubou [-h] [--api-key API_KEY] {tools,jobs,files,account} ...
+
+Zetsubou.life CLI Tool
+
+positional arguments:
+  {tools,jobs,files,account}
+                        Available commands
+    tools               Tool operations
+    jobs                Job operations
+    files               File operations
+    account             Account operations
+
+options:
+  -h, --help            show this help message and exit
+  --api-key API_KEY     API key (or set ZETSUBOU_API_KEY environment variable)
+
 Examples:
   zetsubou tools list
   zetsubou tools list --category video
@@ -204,126 +211,156 @@ Examples:
   zetsubou jobs get job_123
   zetsubou files list
   zetsubou account info
-        """
-    )
-    
-    parser.add_argument(
-        '--api-key',
-        help='API key (or set ZETSUBOU_API_KEY environment variable)',
-        default=None
-    )
-    
-    subparsers = parser.add_subparsers(dest='command', help='Available commands')
-    
-    # Tools commands
-    tools_parser = subparsers.add_parser('tools', help='Tool operations')
-    tools_subparsers = tools_parser.add_subparsers(dest='tools_action')
-    
-    tools_subparsers.add_parser('list', help='List available tools')
-    tools_subparsers.add_parser('execute', help='Execute a tool')
-    
-    # Jobs commands
-    jobs_parser = subparsers.add_parser('jobs', help='Job operations')
-    jobs_subparsers = jobs_parser.add_subparsers(dest='jobs_action')
-    
-    jobs_subparsers.add_parser('list', help='List jobs')
-    jobs_subparsers.add_parser('get', help='Get job details')
-    
-    # Files commands
-    files_parser = subparsers.add_parser('files', help='File operations')
-    files_subparsers = files_parser.add_subparsers(dest='files_action')
-    
-    files_subparsers.add_parser('list', help='List VFS files')
-    
-    # Account commands
-    account_parser = subparsers.add_parser('account', help='Account operations')
-    account_subparsers = account_parser.add_subparsers(dest='account_action')
-    
-    account_subparsers.add_parser('info', help='Show account information')
-    
-    args, unknown_args = parser.parse_known_args()
+"""
+
+
+def _split_global_args(argv: List[str]):
+    """Pull the global --api-key option out of argv, wherever it appears."""
+    api_key = None
+    rest = []
+    i = 0
+    while i < len(argv):
+        arg = argv[i]
+        if arg == '--api-key':
+            if i + 1 >= len(argv):
+                print("Error: --api-key expects a value")
+                sys.exit(2)
+            api_key = argv[i + 1]
+            i += 2
+            continue
+        if arg.startswith('--api-key='):
+            api_key = arg.split('=', 1)[1]
+        else:
+            rest.append(arg)
+        i += 1
+    return api_key, rest
+
+
+def _subparser(prog: str, description: str):
+    """Build an argparse parser for a single sub-action."""
+    import argparse
     
-    # Get API key
-    api_key = args.api_key or os.environ.get('ZETSUBOU_API_KEY')
+    return argparse.ArgumentParser(prog=prog, description=description)
+
+
+def _get_client(api_key: Optional[str]) -> ZetsubouClient:
+    """Resolve the API key and build a client; only called once a command will run."""
+    api_key = api_key or os.environ.get('ZETSUBOU_API_KEY')
     if not api_key:
         print("Error: API key required. Set --api-key or ZETSUBOU_API_KEY environment variable.")
         sys.exit(1)
     
-    # Initialize client
     try:
-        client = ZetsubouClient(api_key)
+        return ZetsubouClient(api_key)
     except Exception as e:
         print(f"Error initializing client: {e}")
         sys.exit(1)
+
+
+def _cmd_help(api_key: Optional[str], argv: List[str]):
+    sys.stdout.write(_HELP)
+
+
+def _cmd_tools(api_key: Optional[str], argv: List[str]):
+    action = argv[0] if argv else None
+    if action == 'list':
+        parser = _subparser('zetsubou tools list', 'List available tools')
+        parser.add_argument('--category', help='Only show tools in this category')
+        args = parser.parse_args(argv[1:])
+        with _get_client(api_key) as client:
+            list_tools(client, args.category)
     
-    try:
-        if args.command == 'tools':
-            if args.tools_action == 'list':
-                category = None
-                if '--category' in unknown_args:
-                    idx = unknown_args.index('--category')
-                    if idx + 1 < len(unknown_args):
-                        category = unknown_args[idx + 1]
-                list_tools(client, category)
-                
-            elif args.tools_action == 'execute':
-                if len(unknown_args) < 2:
-                    print("Error: tool ID and files required")
-                    print("Usage: zetsubou tools execute <tool_id> <file1> [file2] ...")
-                    sys.exit(1)
-                
-                tool_id = unknown_args[0]
-                files = unknown_args[1:]
-                
-                # Parse options if provided
-                options = None
-                if '--options' in unknown_args:
-                    idx = unknown_args.index('--options')
-                    if idx + 1 < len(unknown_args):
-                        try:
-                            options = json.loads(unknown_args[idx + 1])
-                        except json.JSONDecodeError:
-                            print("Error: Invalid JSON in --options")
-                            sys.exit(1)
-                
-                execute_tool(client, tool_id, files, options)
+    elif action == 'execute':
+        parser = _subparser('zetsubou tools execute', 'Execute a tool')
+        parser.add_argument('tool_id', help='Tool identifier')
+        parser.add_argument('files', nargs='+', help='Input files')
+        parser.add_argument('--options', help='Tool options as a JSON object')
+        args = parser.parse_args(argv[1:])
         
-        elif args.command == 'jobs':
-            if args.jobs_action == 'list':
-                status = None
-                if '--status' in unknown_args:
-                    idx = unknown_args.index('--status')
-                    if idx + 1 < len(unknown_args):
-                        status = unknown_args[idx + 1]
-                list_jobs(client, status)
-                
-            elif args.jobs_action == 'get':
-                if len(unknown_args) < 1:
-                    print("Error: job ID required")
-                    print("Usage: zetsubou jobs get <job_id>")
-                    sys.exit(1)
-                get_job(client, unknown_args[0])
-        
-        elif args.command == 'files':
-            if args.files_action == 'list':
-                list_files(client)
+        # Parse options if provided
+        options = None
+        if args.options is not None:
+            try:
+                options = json.loads(args.options)
+            except json.JSONDecodeError:
+                print("Error: Invalid JSON in --options")
+                sys.exit(1)
         
-        elif args.command == 'account':
-            if args.account_action == 'info':
-                account_info(client)
-        
-        else:
-            parser.print_help()
-            
+        with _get_client(api_key) as client:
+            execute_tool(client, args.tool_id, args.files, options)
+    
+    else:
+        print("usage: zetsubou tools {list,execute} ...")
+
+
+def _cmd_jobs(api_key: Optional[str], argv: List[str]):
+    action = argv[0] if argv else None
+    if action == 'list':
+        parser = _subparser('zetsubou jobs list', 'List jobs')
+        parser.add_argument('--status', help='Filter by job status')
+        args = parser.parse_args(argv[1:])
+        with _get_client(api_key) as client:
+            list_jobs(client, args.status)
+    
+    elif action == 'get':
+        parser = _subparser('zetsubou jobs get', 'Get job details')
+        parser.add_argument('job_id', help='Job identifier')
+        args = parser.parse_args(argv[1:])
+        with _get_client(api_key) as client:
+            get_job(client, args.job_id)
+    
+    else:
+        print("usage: zetsubou jobs {list,get} ...")
+
+
+def _cmd_files(api_key: Optional[str], argv: List[str]):
+    action = argv[0] if argv else None
+    if action == 'list':
+        _subparser('zetsubou files list', 'List VFS files').parse_args(argv[1:])
+        with _get_client(api_key) as client:
+            list_files(client)
+    else:
+        print("usage: zetsubou files {list} ...")
+
+
+def _cmd_account(api_key: Optional[str], argv: List[str]):
+    action = argv[0] if argv else None
+    if action == 'info':
+        _subparser('zetsubou account info', 'Show account information').parse_args(argv[1:])
+        with _get_client(api_key) as client:
+            account_info(client)
+    else:
+        print("usage: zetsubou account {info} ...")
+
+
+_COMMANDS = {
+    'tools': _cmd_tools,
+    'jobs': _cmd_jobs,
+    'files': _cmd_files,
+    'account': _cmd_account,
+}
+
+
+def main():
+    """Main CLI function."""
+    # Dispatch on the command word directly; argparse is only imported for
+    # the sub-action that actually runs
+    api_key, argv = _split_global_args(sys.argv[1:])
+    cmd = argv[0] if argv else None
+    
+    # Help and usage paths return before any client is built
+    if cmd in ('-h', '--help'):
+        _cmd_help(api_key, argv[1:])
+        return
+    
+    try:
+        _COMMANDS.get(cmd, _cmd_help)(api_key, argv[1:])
     except KeyboardInterrupt:
         print("\nOperation cancelled by user")
     except ZetsubouError as e:
         print(f"Error: {e}")
         sys.exit(1)
-    finally:
-        client.close()
 
 
 if __name__ == "__main__":
-    import os
-    main()
\ No newline at end of file
+    main()
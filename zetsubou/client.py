@@ -4,22 +4,40 @@ Zetsubou.life API Client
 Main client class that provides access to all API v2 functionality.
 """
 
-import requests
-import json
+import importlib
 import time
-from typing import Optional, Dict, Any, List, Union, BinaryIO
-from urllib.parse import urljoin
+from typing import TYPE_CHECKING, Optional, Dict, Any, Tuple, Union
 
-from .exceptions import (
-    ZetsubouError,
-    AuthenticationError,
-    RateLimitError,
-    ValidationError,
-    NotFoundError,
-    ServerError
-)
-from .models import Tool, Job, VFSNode, ChatConversation, ChatMessage, Webhook, Account, StorageQuota
-from .services import ToolsService, JobsService, VFSService, ChatService, WebhooksService, AccountService, NFTService, GraphQLService
+from . import __version__ as _SDK_VERSION
+from ._errors import RATE_LIMIT, RETRY_STATUSES, parse_error_body, raise_for_status
+from ._multipart import MultipartBody
+from .exceptions import ZetsubouError, ConnectionError as APIConnectionError, TimeoutError as APITimeoutError
+from .utils import parse_json
+
+if TYPE_CHECKING:
+    import requests
+    from .services import ToolsService, JobsService, VFSService, ChatService, WebhooksService, AccountService, NFTService, GraphQLService
+
+_USER_AGENT = f'zetsubou-sdk-python/{_SDK_VERSION}'
+
+# Default session headers (requests' own defaults plus ours); X-API-Key is
+# added per client
+_BASE_HEADERS = {
+    'User-Agent': _USER_AGENT,
+    'Accept-Encoding': 'gzip, deflate',
+    'Accept': '*/*',
+    'Connection': 'keep-alive',
+    'Content-Type': 'application/json'
+}
+
+# Statuses retried by the session's urllib3 policy; 429s honour Retry-After
+_RETRY_STATUS_FORCELIST = RETRY_STATUSES + (RATE_LIMIT,)
+
+# Methods urllib3 may retry on connection errors and retried statuses
+_RETRY_METHODS = frozenset(['GET', 'POST', 'PUT', 'PATCH', 'DELETE'])
+
+# Maximum number of cached (TTL or ETag) GET responses kept per client
+_GET_CACHE_SIZE = 128
 
 
 class ZetsubouClient:
@@ -31,8 +49,33 @@ class ZetsubouClient:
         base_url: API base URL (default: https://zetsubou.life)
         timeout: Request timeout in seconds (default: 30)
         retry_attempts: Number of retry attempts for failed requests (default: 3)
+    
+    Service objects (``tools``, ``jobs``, ``vfs``, ...) are imported and
+    instantiated on first access and cached on the instance afterwards.
     """
     
+    # Attribute name -> (module, class) for lazily constructed services
+    _SERVICE_MAP = {
+        'tools': ('zetsubou.services.tools', 'ToolsService'),
+        'jobs': ('zetsubou.services.jobs', 'JobsService'),
+        'vfs': ('zetsubou.services.vfs', 'VFSService'),
+        'chat': ('zetsubou.services.chat', 'ChatService'),
+        'webhooks': ('zetsubou.services.webhooks', 'WebhooksService'),
+        'account': ('zetsubou.services.account', 'AccountService'),
+        'nft': ('zetsubou.services.nft', 'NFTService'),
+        'graphql': ('zetsubou.services.graphql', 'GraphQLService'),
+    }
+    
+    if TYPE_CHECKING:
+        tools: ToolsService
+        jobs: JobsService
+        vfs: VFSService
+        chat: ChatService
+        webhooks: WebhooksService
+        account: AccountService
+        nft: NFTService
+        graphql: GraphQLService
+    
     def __init__(
         self,
         api_key: str,
@@ -45,43 +88,91 @@ class ZetsubouClient:
         self.timeout = timeout
         self.retry_attempts = retry_attempts
         
-        # Initialize session with default headers
-        self.session = requests.Session()
-        self.session.headers.update({
-            'X-API-Key': api_key,
-            'User-Agent': f'zetsubou-sdk-python/{__import__("zetsubou").__version__}',
-            'Content-Type': 'application/json'
-        })
-        
-        # Initialize service modules
-        self.tools = ToolsService(self)
-        self.jobs = JobsService(self)
-        self.vfs = VFSService(self)
-        self.chat = ChatService(self)
-        self.webhooks = WebhooksService(self)
-        self.account = AccountService(self)
-        self.nft = NFTService(self)
-        self.graphql = GraphQLService(self)
+        # The HTTP session is created on first use so that importing and
+        # constructing the client never pays for importing requests/urllib3
+        self._session = None
+        
+        # (endpoint, params key) -> (expires_at, response) for get(cache_ttl=...)
+        self._get_cache = {}
+        # (endpoint, params key) -> (ETag, response) for get(revalidate=True)
+        self._etag_cache = {}
+    
+    def __getattr__(self, name: str):
+        # Only called on attribute misses, so cached services resolve normally
+        spec = type(self)._SERVICE_MAP.get(name)
+        if spec is None:
+            raise AttributeError(f"{type(self).__name__!r} object has no attribute {name!r}")
+        module = importlib.import_module(spec[0])
+        service = getattr(module, spec[1])(self)
+        object.__setattr__(self, name, service)
+        return service
+    
+    @property
+    def session(self) -> 'requests.Session':
+        """HTTP session with default headers, created on first access."""
+        if self._session is None:
+            import requests
+            from requests.structures import CaseInsensitiveDict
+            
+            from ._retry import RetryPolicy
+            from ._transport import TransportAdapter
+            
+            session = requests.Session()
+            # Replace the headers wholesale rather than merging via update()
+            headers = CaseInsensitiveDict(_BASE_HEADERS)
+            headers['X-API-Key'] = self.api_key
+            session.headers = headers
+            
+            # Connection errors, timeouts, 5xx and short-lived 429 responses
+            # are retried with backoff inside urllib3; the final error
+            # response is returned (raise_on_status=False) so it can be
+            # mapped to ServerError/RateLimitError
+            retry = RetryPolicy(
+                total=self.retry_attempts,
+                backoff_factor=0.5,
+                status_forcelist=_RETRY_STATUS_FORCELIST,
+                allowed_methods=_RETRY_METHODS,
+                respect_retry_after_header=True,
+                raise_on_status=False
+            )
+            adapter = TransportAdapter(max_retries=retry, pool_connections=10, pool_maxsize=20)
+            session.mount('https://', adapter)
+            session.mount('http://', adapter)
+            self._session = session
+        return self._session
     
     def _make_request(
         self,
         method: str,
         endpoint: str,
         params: Optional[Dict[str, Any]] = None,
-        data: Optional[Dict[str, Any]] = None,
+        data: Optional[Union[Dict[str, Any], bytes]] = None,
         files: Optional[Dict[str, Any]] = None,
-        stream: bool = False
-    ) -> requests.Response:
+        stream: bool = False,
+        headers: Optional[Dict[str, Optional[str]]] = None,
+        timeout: Optional[Union[float, Tuple[float, float]]] = None
+    ) -> 'requests.Response':
         """
-        Make an HTTP request to the API with retry logic and error handling.
+        Make an HTTP request to the API with error handling.
+        
+        Connection errors, timeouts, 5xx responses and 429 responses with a
+        ``Retry-After`` of at most ``MAX_RETRY_AFTER`` seconds are retried by
+        the session's urllib3 retry policy (``retry_attempts`` times).
         
         Args:
             method: HTTP method (GET, POST, PUT, DELETE, PATCH)
             endpoint: API endpoint (e.g., '/api/v2/tools')
             params: Query parameters
-            data: Request body data
+            data: Request body data; pre-encoded JSON ``bytes`` (see
+                :func:`~zetsubou.utils.dumps_json`) are sent as-is
             files: Files to upload (for multipart requests)
             stream: Whether to stream the response
+            headers: Per-request header overrides merged over the session
+                defaults (e.g. ``{'X-API-Key': other_key}`` to act on behalf
+                of another key from one shared client; ``None`` values remove
+                a default header)
+            timeout: Per-request timeout in seconds, or a ``(connect, read)``
+                tuple (default: the client's ``timeout``)
             
         Returns:
             requests.Response object
@@ -89,115 +180,143 @@ class ZetsubouClient:
         Raises:
             ZetsubouError: For various API errors
         """
-        url = urljoin(self.base_url, endpoint)
+        import requests
+        
+        if endpoint.startswith('/'):
+            url = self.base_url + endpoint
+        else:
+            url = self.base_url + '/' + endpoint
         
-        # Prepare headers
-        headers = {}
+        # Uploads are streamed from the open files as the body is sent instead
+        # of being assembled in memory by requests; the part Content-Type
+        # replaces the session's JSON default
         if files:
-            # Remove Content-Type for multipart requests
-            headers = {k: v for k, v in self.session.headers.items() if k.lower() != 'content-type'}
-        
-        # Retry logic
-        last_exception = None
-        for attempt in range(self.retry_attempts + 1):
-            try:
-                response = self.session.request(
-                    method=method,
-                    url=url,
-                    params=params,
-                    json=data if not files else None,
-                    data=data if files else None,
-                    files=files,
-                    headers=headers,
-                    timeout=self.timeout,
-                    stream=stream
-                )
-                
-                # Handle different status codes
-                if response.status_code == 200:
-                    return response
-                elif response.status_code == 201:
-                    return response
-                elif response.status_code == 204:
-                    return response
-                elif response.status_code == 400:
-                    error_data = self._parse_error_response(response)
-                    raise ValidationError(error_data.get('message', 'Validation error'), error_data)
-                elif response.status_code == 401:
-                    error_data = self._parse_error_response(response)
-                    raise AuthenticationError(error_data.get('message', 'Authentication failed'), error_data)
-                elif response.status_code == 404:
-                    error_data = self._parse_error_response(response)
-                    raise NotFoundError(error_data.get('message', 'Resource not found'), error_data)
-                elif response.status_code == 429:
-                    error_data = self._parse_error_response(response)
-                    retry_after = int(response.headers.get('Retry-After', 60))
-                    raise RateLimitError(
-                        error_data.get('message', 'Rate limit exceeded'),
-                        error_data,
-                        retry_after=retry_after
-                    )
-                elif 500 <= response.status_code < 600:
-                    error_data = self._parse_error_response(response)
-                    if attempt < self.retry_attempts:
-                        # Retry on server errors
-                        time.sleep(2 ** attempt)  # Exponential backoff
-                        continue
-                    raise ServerError(error_data.get('message', 'Server error'), error_data)
-                else:
-                    error_data = self._parse_error_response(response)
-                    raise ZetsubouError(
-                        f"Unexpected status code {response.status_code}: {error_data.get('message', 'Unknown error')}",
-                        error_data
-                    )
-                    
-            except (requests.exceptions.Timeout, requests.exceptions.ConnectionError) as e:
-                last_exception = e
-                if attempt < self.retry_attempts:
-                    time.sleep(2 ** attempt)
-                    continue
-                raise ZetsubouError(f"Request failed after {self.retry_attempts} retries: {str(e)}")
-            except ZetsubouError:
-                # Re-raise our custom errors immediately
-                raise
-            except Exception as e:
-                last_exception = e
-                if attempt < self.retry_attempts:
-                    time.sleep(2 ** attempt)
-                    continue
-                raise ZetsubouError(f"Unexpected error: {str(e)}")
-        
-        # If we get here, all retries failed
-        raise ZetsubouError(f"Request failed after {self.retry_attempts} retries: {str(last_exception)}")
-    
-    def _parse_error_response(self, response: requests.Response) -> Dict[str, Any]:
+            data = MultipartBody(data, files)
+            multipart = {'Content-Type': data.content_type}
+            headers = {**multipart, **headers} if headers else multipart
+        
+        # Multipart and pre-encoded bodies go out as-is; dicts are encoded by
+        # requests (the session's Content-Type is already JSON)
+        raw_body = isinstance(data, (bytes, MultipartBody))
+        
+        # Retries and backoff are handled by the session's urllib3 adapter
+        try:
+            response = self.session.request(
+                method=method,
+                url=url,
+                params=params,
+                json=data if not raw_body else None,
+                data=data if raw_body else None,
+                headers=headers,
+                timeout=self.timeout if timeout is None else timeout,
+                stream=stream
+            )
+        except requests.exceptions.Timeout as e:
+            raise APITimeoutError(f"Request failed after {self.retry_attempts} retries: {str(e)}")
+        except requests.exceptions.ConnectionError as e:
+            raise APIConnectionError(f"Request failed after {self.retry_attempts} retries: {str(e)}")
+        except Exception as e:
+            raise ZetsubouError(f"Unexpected error: {str(e)}")
+        
+        status = response.status_code
+        # 304 only answers a conditional (If-None-Match) request the caller made
+        if 200 <= status < 300 or status == 304:
+            return response
+        
+        raise_for_status(status, self._parse_error_response(response), response.headers)
+    
+    def _parse_error_response(self, response: 'requests.Response') -> Dict[str, Any]:
         """Parse error response from API."""
+        return parse_error_body(response.content, response.status_code)
+    
+    def get(
+        self,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        stream: bool = False,
+        cache_ttl: Optional[float] = None,
+        headers: Optional[Dict[str, Optional[str]]] = None,
+        revalidate: bool = False,
+        timeout: Optional[Union[float, Tuple[float, float]]] = None
+    ) -> 'requests.Response':
+        """
+        Make a GET request.
+        
+        Args:
+            endpoint: API endpoint
+            params: Query parameters
+            stream: Whether to stream the response (never cached)
+            cache_ttl: If set, reuse an identical GET made within the last
+                ``cache_ttl`` seconds on this client instead of hitting the API
+            headers: Per-request header overrides (requests with overrides are
+                never cached)
+            revalidate: If set, send the ``ETag`` of the last identical GET as
+                ``If-None-Match`` and return that earlier response when the
+                server answers ``304 Not Modified``
+            timeout: Per-request timeout in seconds, or a ``(connect, read)``
+                tuple (default: the client's ``timeout``)
+        """
+        if not (cache_ttl or revalidate) or stream or headers:
+            return self._make_request('GET', endpoint, params=params, stream=stream, headers=headers, timeout=timeout)
+        
         try:
-            return response.json()
-        except (ValueError, KeyError):
-            return {
-                'message': response.text or f'HTTP {response.status_code}',
-                'code': f'HTTP_{response.status_code}',
-                'status_code': response.status_code
-            }
-    
-    def get(self, endpoint: str, params: Optional[Dict[str, Any]] = None) -> requests.Response:
-        """Make a GET request."""
-        return self._make_request('GET', endpoint, params=params)
-    
-    def post(self, endpoint: str, data: Optional[Dict[str, Any]] = None, files: Optional[Dict[str, Any]] = None) -> requests.Response:
+            key = (endpoint, tuple(sorted(params.items())) if params else ())
+            hash(key)
+        except TypeError:
+            # Unhashable parameter values (e.g. lists) are simply not cached
+            return self._make_request('GET', endpoint, params=params, timeout=timeout)
+        
+        if revalidate:
+            return self._revalidated_get(key, endpoint, params, timeout)
+        
+        now = time.monotonic()
+        entry = self._get_cache.get(key)
+        if entry is not None and entry[0] > now:
+            return entry[1]
+        
+        response = self._make_request('GET', endpoint, params=params, timeout=timeout)
+        self._get_cache.pop(key, None)
+        self._get_cache[key] = (now + cache_ttl, response)
+        if len(self._get_cache) > _GET_CACHE_SIZE:
+            # Evict the oldest entry
+            self._get_cache.pop(next(iter(self._get_cache)), None)
+        return response
+    
+    def _revalidated_get(
+        self,
+        key,
+        endpoint: str,
+        params: Optional[Dict[str, Any]],
+        timeout: Optional[Union[float, Tuple[float, float]]] = None
+    ) -> 'requests.Response':
+        """Make a conditional GET against the last response stored for ``key``."""
+        known = self._etag_cache.get(key)
+        headers = {'If-None-Match': known[0]} if known else None
+        response = self._make_request('GET', endpoint, params=params, headers=headers, timeout=timeout)
+        if response.status_code == 304 and known:
+            return known[1]
+        
+        etag = response.headers.get('ETag')
+        self._etag_cache.pop(key, None)
+        if etag:
+            self._etag_cache[key] = (etag, response)
+            if len(self._etag_cache) > _GET_CACHE_SIZE:
+                self._etag_cache.pop(next(iter(self._etag_cache)), None)
+        return response
+    
+    def post(self, endpoint: str, data: Optional[Union[Dict[str, Any], bytes]] = None, files: Optional[Dict[str, Any]] = None) -> 'requests.Response':
         """Make a POST request."""
         return self._make_request('POST', endpoint, data=data, files=files)
     
-    def put(self, endpoint: str, data: Optional[Dict[str, Any]] = None) -> requests.Response:
+    def put(self, endpoint: str, data: Optional[Dict[str, Any]] = None) -> 'requests.Response':
         """Make a PUT request."""
         return self._make_request('PUT', endpoint, data=data)
     
-    def patch(self, endpoint: str, data: Optional[Dict[str, Any]] = None) -> requests.Response:
+    def patch(self, endpoint: str, data: Optional[Dict[str, Any]] = None) -> 'requests.Response':
         """Make a PATCH request."""
         return self._make_request('PATCH', endpoint, data=data)
     
-    def delete(self, endpoint: str) -> requests.Response:
+    def delete(self, endpoint: str) -> 'requests.Response':
         """Make a DELETE request."""
         return self._make_request('DELETE', endpoint)
     
@@ -205,15 +324,31 @@ class ZetsubouClient:
         """
         Check API health status.
         
+        Results are cached on the client for 5 seconds so readiness probes
+        polling in a loop do not hit the API on every call.
+        
         Returns:
             Health status information
         """
-        response = self.get('/health')
-        return response.json()
+        response = self.get('/health', cache_ttl=5)
+        return parse_json(response)
+    
+    def clear_cache(self):
+        """Drop all cached GET responses and cached service results."""
+        from .services._cache import invalidate
+        
+        self._get_cache.clear()
+        self._etag_cache.clear()
+        for name in self._SERVICE_MAP:
+            service = self.__dict__.get(name)
+            if service is not None:
+                invalidate(service)
     
     def close(self):
         """Close the HTTP session."""
-        self.session.close()
+        if self._session is not None:
+            self._session.close()
+            self._session = None
     
     def __enter__(self):
         return self
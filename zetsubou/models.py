@@ -4,12 +4,38 @@ Zetsubou.life SDK Data Models
 Data classes representing API responses and entities.
 """
 
+import sys
+from functools import lru_cache
 from dataclasses import dataclass
-from typing import Optional, List, Dict, Any, Union
+from typing import Optional, List, Dict, Any, Iterable, Union
 from datetime import datetime
 
+# RFC 3339 timestamp parser: ciso8601 (from the "fast" extra) when available,
+# otherwise fromisoformat, which only accepts a trailing 'Z' from 3.11 on
+try:
+    from ciso8601 import parse_datetime as _parse_dt
+except ImportError:
+    if sys.version_info >= (3, 11):
+        _parse_dt = datetime.fromisoformat
+    else:
+        def _parse_dt(value: str) -> datetime:
+            return datetime.fromisoformat(value.replace('Z', '+00:00'))
 
-@dataclass
+# Rows in one listing often share timestamps (bulk-created or batch-updated
+# records); datetimes are immutable, so parsed values can be shared
+_parse_dt = lru_cache(maxsize=4096)(_parse_dt)
+
+
+def _intern(value):
+    """Intern enum-like string fields ('status', 'role', ...) so rows share one object."""
+    return sys.intern(value) if type(value) is str else value
+
+
+# Slotted dataclasses (no per-instance __dict__) where supported (3.10+)
+_DATACLASS_OPTIONS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_DATACLASS_OPTIONS)
 class Tool:
     """Represents a tool available in the API."""
     id: str
@@ -32,10 +58,10 @@ class Tool:
             id=data['id'],
             name=data['name'],
             description=data.get('description'),
-            category=data['category'],
-            input_type=data['input_type'],
-            output_type=data['output_type'],
-            required_tier=data['required_tier'],
+            category=_intern(data['category']),
+            input_type=_intern(data['input_type']),
+            output_type=_intern(data['output_type']),
+            required_tier=_intern(data['required_tier']),
             accessible=data['accessible'],
             options=data.get('options', {}),
             supports_audio=data.get('supports_audio', False),
@@ -44,7 +70,7 @@ class Tool:
         )
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class Job:
     """Represents an asynchronous job."""
     id: str
@@ -65,10 +91,10 @@ class Job:
         return cls(
             id=data.get('id') or data.get('job_id'),  # Support both id and job_id
             tool_id=data.get('tool_id') or data.get('tool'),  # Support both formats
-            status=data['status'],
-            created_at=datetime.fromisoformat(data['created_at'].replace('Z', '+00:00')),
-            updated_at=datetime.fromisoformat(data['updated_at'].replace('Z', '+00:00')) if data.get('updated_at') else None,
-            completed_at=datetime.fromisoformat(data['completed_at'].replace('Z', '+00:00')) if data.get('completed_at') else None,
+            status=_intern(data['status']),
+            created_at=_parse_dt(data['created_at']),
+            updated_at=_parse_dt(data['updated_at']) if data.get('updated_at') else None,
+            completed_at=_parse_dt(data['completed_at']) if data.get('completed_at') else None,
             progress=data.get('progress', 0),
             error=data.get('error'),
             inputs=data.get('inputs') or data.get('input_files', []),  # Support both formats
@@ -77,7 +103,7 @@ class Job:
         )
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class VFSNode:
     """Represents a VFS node (file or folder)."""
     id: str
@@ -94,21 +120,55 @@ class VFSNode:
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'VFSNode':
         """Create VFSNode from API response."""
-        return cls(
-            id=data['id'],
-            name=data['name'],
-            type=data['type'],
-            size_bytes=data['size_bytes'],
-            mime_type=data.get('mime_type'),
-            created_at=datetime.fromisoformat(data['created_at'].replace('Z', '+00:00')),
-            updated_at=datetime.fromisoformat(data['updated_at'].replace('Z', '+00:00')),
-            parent_id=data.get('parent_id'),
-            is_encrypted=data.get('is_encrypted', False),
-            download_url=data.get('download_url')
-        )
+        # Same direct field stores as from_dicts, without its batch setup
+        node = cls.__new__(cls)
+        node.id = data['id']
+        node.name = data['name']
+        node.type = _intern(data['type'])
+        node.size_bytes = data['size_bytes']
+        node.mime_type = data.get('mime_type')
+        node.created_at = _parse_dt(data['created_at'])
+        node.updated_at = _parse_dt(data['updated_at'])
+        node.parent_id = data.get('parent_id')
+        node.is_encrypted = data.get('is_encrypted', False)
+        node.download_url = data.get('download_url')
+        return node
+    
+    @classmethod
+    def from_dicts(cls, rows: Iterable[Dict[str, Any]]) -> List['VFSNode']:
+        """
+        Create VFSNodes from a list of API response items.
+        
+        Instances are allocated with ``__new__`` and their fields stored
+        directly, skipping the keyword-argument ``__init__`` call per row.
+        Repeated ``mime_type`` and ``parent_id`` values (a folder listing
+        shares one parent and a handful of types) are deduplicated, so the
+        nodes share one string object per distinct value.
+        """
+        new = cls.__new__
+        parse_dt = _parse_dt
+        shared = {}.setdefault
+        nodes = []
+        append = nodes.append
+        for data in rows:
+            node = new(cls)
+            node.id = data['id']
+            node.name = data['name']
+            node.type = _intern(data['type'])
+            node.size_bytes = data['size_bytes']
+            mime_type = data.get('mime_type')
+            node.mime_type = shared(mime_type, mime_type)
+            node.created_at = parse_dt(data['created_at'])
+            node.updated_at = parse_dt(data['updated_at'])
+            parent_id = data.get('parent_id')
+            node.parent_id = shared(parent_id, parent_id)
+            node.is_encrypted = data.get('is_encrypted', False)
+            node.download_url = data.get('download_url')
+            append(node)
+        return nodes
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class ChatMessage:
     """Represents a chat message."""
     uuid: str
@@ -121,13 +181,13 @@ class ChatMessage:
         """Create ChatMessage from API response."""
         return cls(
             uuid=data.get('uuid') or data.get('id', ''),  # Support both uuid and legacy id
-            role=data['role'],
+            role=_intern(data['role']),
             content=data['content'],
-            timestamp=datetime.fromisoformat(data['timestamp'].replace('Z', '+00:00'))
+            timestamp=_parse_dt(data['timestamp'])
         )
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class ChatConversation:
     """Represents a chat conversation."""
     uuid: str
@@ -149,14 +209,14 @@ class ChatConversation:
             uuid=data.get('uuid') or data.get('id', ''),  # Support both uuid and legacy id
             title=data['title'],
             model=data['model'],
-            created_at=datetime.fromisoformat(data['created_at'].replace('Z', '+00:00')),
-            updated_at=datetime.fromisoformat(data['updated_at'].replace('Z', '+00:00')),
+            created_at=_parse_dt(data['created_at']),
+            updated_at=_parse_dt(data['updated_at']),
             message_count=data.get('message_count', 0),
             last_message=last_message
         )
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class Webhook:
     """Represents a webhook configuration."""
     id: int
@@ -172,20 +232,43 @@ class Webhook:
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'Webhook':
         """Create Webhook from API response."""
-        return cls(
-            id=data['id'],
-            url=data['url'],
-            events=data['events'],
-            enabled=data['enabled'],
-            success_count=data.get('success_count', 0),
-            failure_count=data.get('failure_count', 0),
-            last_delivery_at=datetime.fromisoformat(data['last_delivery_at'].replace('Z', '+00:00')) if data.get('last_delivery_at') else None,
-            created_at=datetime.fromisoformat(data['created_at'].replace('Z', '+00:00')),
-            updated_at=datetime.fromisoformat(data['updated_at'].replace('Z', '+00:00'))
-        )
+        webhook = cls.__new__(cls)
+        webhook.id = data['id']
+        webhook.url = data['url']
+        webhook.events = data['events']
+        webhook.enabled = data['enabled']
+        webhook.success_count = data.get('success_count', 0)
+        webhook.failure_count = data.get('failure_count', 0)
+        last_delivery_at = data.get('last_delivery_at')
+        webhook.last_delivery_at = _parse_dt(last_delivery_at) if last_delivery_at else None
+        webhook.created_at = _parse_dt(data['created_at'])
+        webhook.updated_at = _parse_dt(data['updated_at'])
+        return webhook
+    
+    @classmethod
+    def from_dicts(cls, rows: Iterable[Dict[str, Any]]) -> List['Webhook']:
+        """Create Webhooks from a list of API response items (see :meth:`VFSNode.from_dicts`)."""
+        new = cls.__new__
+        parse_dt = _parse_dt
+        webhooks = []
+        append = webhooks.append
+        for data in rows:
+            webhook = new(cls)
+            webhook.id = data['id']
+            webhook.url = data['url']
+            webhook.events = data['events']
+            webhook.enabled = data['enabled']
+            webhook.success_count = data.get('success_count', 0)
+            webhook.failure_count = data.get('failure_count', 0)
+            last_delivery_at = data.get('last_delivery_at')
+            webhook.last_delivery_at = parse_dt(last_delivery_at) if last_delivery_at else None
+            webhook.created_at = parse_dt(data['created_at'])
+            webhook.updated_at = parse_dt(data['updated_at'])
+            append(webhook)
+        return webhooks
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class Account:
     """Represents user account information."""
     user_id: int
@@ -204,15 +287,15 @@ class Account:
             user_id=data['user_id'],
             username=data['username'],
             email=data['email'],
-            tier=data['tier'],
-            created_at=datetime.fromisoformat(data['created_at'].replace('Z', '+00:00')),
+            tier=_intern(data['tier']),
+            created_at=_parse_dt(data['created_at']),
             subscription=data.get('subscription', {}),
             usage=data.get('usage', {}),
             features=data.get('features', {})
         )
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class StorageQuota:
     """Represents storage quota information."""
     tier: str
@@ -229,7 +312,7 @@ class StorageQuota:
     def from_dict(cls, data: Dict[str, Any]) -> 'StorageQuota':
         """Create StorageQuota from API response."""
         return cls(
-            tier=data['tier'],
+            tier=_intern(data['tier']),
             quota_bytes=int(data['quota_bytes']),
             used_bytes=int(data['used_bytes']),
             available_bytes=int(data['available_bytes']),
@@ -2,24 +2,62 @@
 Zetsubou.life SDK Services
 
 Service modules for different API functionality areas.
+
+Service classes are resolved lazily on first access, so importing a single
+service module does not import the others.
 """
 
-from .tools import ToolsService
-from .jobs import JobsService
-from .vfs import VFSService
-from .chat import ChatService
-from .webhooks import WebhooksService
-from .account import AccountService
-from .nft import NFTService
-from .graphql import GraphQLService
+import importlib
+from typing import TYPE_CHECKING
 
 __all__ = [
     'ToolsService',
     'JobsService', 
+    'AsyncJobsService',
     'VFSService',
+    'AsyncVFSService',
     'ChatService',
     'WebhooksService',
+    'AsyncWebhooksService',
     'AccountService',
     'NFTService',
     'GraphQLService'
-]
\ No newline at end of file
+]
+
+_LAZY = {
+    'ToolsService': '.tools',
+    'JobsService': '.jobs',
+    'AsyncJobsService': '.jobs',
+    'VFSService': '.vfs',
+    'AsyncVFSService': '.vfs',
+    'ChatService': '.chat',
+    'WebhooksService': '.webhooks',
+    'AsyncWebhooksService': '.webhooks',
+    'AccountService': '.account',
+    'NFTService': '.nft',
+    'GraphQLService': '.graphql',
+}
+
+if TYPE_CHECKING:
+    from .tools import ToolsService
+    from .jobs import JobsService, AsyncJobsService
+    from .vfs import VFSService, AsyncVFSService
+    from .chat import ChatService
+    from .webhooks import WebhooksService, AsyncWebhooksService
+    from .account import AccountService
+    from .nft import NFTService
+    from .graphql import GraphQLService
+
+
+def __getattr__(name):
+    try:
+        module_name = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + list(_LAZY))
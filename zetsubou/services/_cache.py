@@ -0,0 +1,170 @@
+"""
+Service Response Cache
+
+Per-service TTL cache for idempotent read methods.
+"""
+
+import functools
+import threading
+import time
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from ..exceptions import ConnectionError as APIConnectionError, TimeoutError as APITimeoutError
+
+# Cache policy -> time to live in seconds
+POLICIES = {
+    'short': 5,
+    'normal': 30,
+    'long': 60,
+    'static': 300,
+}
+
+# Maximum number of entries kept per service instance (expired entries are
+# kept too, as fallbacks while the API is unreachable)
+MAX_ENTRIES = 128
+
+# Guards cache writes and evictions, which background refreshes make
+# concurrently with callers' threads
+_lock = threading.Lock()
+
+
+def _entries(service) -> Dict[Tuple, Tuple[float, Any]]:
+    return service.__dict__.setdefault('_ttl_cache', {})
+
+
+def _copy(result: Any) -> Any:
+    # Every caller gets its own container, so mutating a returned list or
+    # dict does not change what later cache hits return
+    if isinstance(result, (list, dict)):
+        return result.copy()
+    return result
+
+
+def _store(entries: Dict[Tuple, Tuple[float, Any]], key: Tuple, expires_at: float, result: Any):
+    with _lock:
+        entries.pop(key, None)
+        entries[key] = (expires_at, result)
+        if len(entries) > MAX_ENTRIES:
+            # Evict the oldest entry
+            entries.pop(next(iter(entries)), None)
+
+
+def _refresh(service, entries, key: Tuple, func: Callable, args: Tuple, kwargs: Dict, ttl: float):
+    """Re-run ``func`` on a background thread and store its result under ``key``."""
+    refreshing = service.__dict__.setdefault('_ttl_refreshing', set())
+    with _lock:
+        if key in refreshing:
+            return
+        refreshing.add(key)
+    
+    def run():
+        try:
+            result = func(service, *args, **kwargs)
+        except Exception:
+            # Keep serving the stale entry; the next call retries
+            return
+        finally:
+            refreshing.discard(key)
+        # ``entries`` is replaced (not cleared) on invalidation, so a refresh
+        # that finishes after a write is stored in the discarded dict
+        _store(entries, key, time.monotonic() + ttl, result)
+    
+    # Daemon thread, so an in-flight refresh never delays interpreter exit
+    threading.Thread(target=run, name='zetsubou-cache-refresh', daemon=True).start()
+
+
+def cached(policy: str = 'normal', stale_ttl: Optional[float] = None) -> Callable:
+    """
+    Cache a service method's result for the TTL of ``policy``.
+    
+    Results are keyed on the method name and its arguments and stored on the
+    service instance. The decorated method accepts an extra ``use_cache``
+    keyword; ``use_cache=False`` always calls the API (and refreshes the
+    cache), and its errors are raised. Otherwise, if the API cannot be
+    reached (connection error or timeout), the last cached (even expired)
+    result for the same call is returned instead; API errors, including
+    5xx responses, are always raised. Lists and dicts are returned as
+    shallow copies of the cached value.
+    
+    With ``stale_ttl``, a result that expired less than ``stale_ttl``
+    seconds ago is returned immediately while a background thread fetches
+    a fresh one (stale-while-revalidate).
+    
+    Args:
+        policy: 'short' (5s), 'normal' (30s), 'long' (60s) or 'static'
+            (300s, for reference data such as event catalogues)
+        stale_ttl: Optional stale-while-revalidate window in seconds
+    """
+    ttl = POLICIES[policy]
+    
+    def decorator(func: Callable) -> Callable:
+        name = func.__name__
+        
+        @functools.wraps(func)
+        def wrapper(self, *args, use_cache: bool = True, **kwargs):
+            try:
+                key = (name, args, tuple(sorted(kwargs.items())))
+                hash(key)
+            except TypeError:
+                # Unhashable arguments (e.g. lists) are simply not cached
+                return func(self, *args, **kwargs)
+            
+            entries = _entries(self)
+            entry = entries.get(key)
+            now = time.monotonic()
+            if use_cache and entry is not None:
+                if entry[0] > now:
+                    return _copy(entry[1])
+                if stale_ttl and entry[0] + stale_ttl > now:
+                    _refresh(self, entries, key, func, args, kwargs, ttl)
+                    return _copy(entry[1])
+            
+            try:
+                result = func(self, *args, **kwargs)
+            except (APIConnectionError, APITimeoutError):
+                # A caller bypassing the cache asked for fresh data
+                if entry is None or not use_cache:
+                    raise
+                return _copy(entry[1])
+            
+            _store(entries, key, now + ttl, result)
+            return _copy(result)
+        
+        return wrapper
+    
+    return decorator
+
+
+def prime(service, method_name: str, args: Tuple, result: Any, policy: str = 'short'):
+    """Store ``result`` as the cached value of ``service.<method_name>(*args)``."""
+    _store(_entries(service), (method_name, args, ()), time.monotonic() + POLICIES[policy], result)
+
+
+def invalidate_peer(service, name: str):
+    """
+    Drop the cached results of the client's ``name`` service, if it exists.
+    
+    For writes in one service that change what another returns (e.g. VFS
+    uploads and the account's storage quota).
+    """
+    peer = vars(service.client).get(name)
+    if peer is not None:
+        invalidate(peer)
+
+
+def invalidate(service, keep: Tuple[str, ...] = ()):
+    """
+    Drop the cached results held by ``service``.
+    
+    Args:
+        service: Service instance
+        keep: Names of methods whose results are unaffected by the write
+            (e.g. reference data) and stay cached
+    """
+    # Swap in a new dict rather than clearing in place, so background
+    # refreshes started before the write land in the discarded one
+    entries = service.__dict__.pop('_ttl_cache', None)
+    if keep and entries:
+        with _lock:
+            kept = {key: entry for key, entry in entries.items() if key[0] in keep}
+        service.__dict__['_ttl_cache'] = kept
@@ -4,9 +4,12 @@ Account Service
 Handles account information, usage statistics, and API key management.
 """
 
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Any, Optional
 from ..models import Account, StorageQuota
 from ..exceptions import ZetsubouError
+from ..utils import parse_json
+from ._cache import cached, invalidate
 
 
 class AccountService:
@@ -15,28 +18,41 @@ class AccountService:
     def __init__(self, client):
         self.client = client
     
+    @cached('normal')
     def get_account(self) -> Account:
         """
         Get current account information.
         
+        Cached for 30 seconds, so helpers such as :meth:`get_tier_info` and
+        :meth:`get_rate_limits` share one request; pass ``use_cache=False``
+        to force a fresh fetch.
+        
         Returns:
             Account object
         """
         response = self.client.get('/api/v2/account')
-        data = response.json()
+        data = parse_json(response)
         return Account.from_dict(data)
     
+    @cached('normal')
     def get_storage_quota(self) -> StorageQuota:
         """
         Get detailed storage quota information.
         
+        Cached for 30 seconds (VFS uploads and deletes drop the cached
+        quota); pass ``use_cache=False`` to force a fresh fetch.
+        
         Returns:
             StorageQuota object
         """
         response = self.client.get('/api/v2/storage/quota')
-        data = response.json()
+        data = parse_json(response)
         return StorageQuota.from_dict(data)
     
+    def invalidate_account(self):
+        """Drop cached account and storage quota data so the next call refetches it."""
+        invalidate(self)
+    
     def get_usage_stats(
         self,
         period: str = "30d",
@@ -57,7 +73,35 @@ class AccountService:
             params['tool_id'] = tool_id
         
         response = self.client.get('/api/v2/account/usage', params=params)
-        return response.json()
+        return parse_json(response)
+    
+    def get_dashboard(self, period: str = "30d") -> Dict[str, Any]:
+        """
+        Get account, storage quota and usage statistics together.
+        
+        The three requests are independent, so they are issued concurrently
+        and the call takes roughly as long as the slowest one.
+        
+        Args:
+            period: Time period for usage statistics ('7d', '30d', '90d', '1y')
+            
+        Returns:
+            Dictionary with 'account' (Account), 'storage_quota'
+            (StorageQuota) and 'usage' (dict) keys
+        """
+        # Create the shared session up front rather than racing to build it
+        # from the worker threads
+        self.client.session
+        
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            account = executor.submit(self.get_account)
+            quota = executor.submit(self.get_storage_quota)
+            usage = executor.submit(self.get_usage_stats, period)
+            return {
+                'account': account.result(),
+                'storage_quota': quota.result(),
+                'usage': usage.result()
+            }
     
     def list_api_keys(self) -> List[Dict[str, Any]]:
         """
@@ -67,7 +111,7 @@ class AccountService:
             List of API key information
         """
         response = self.client.get('/api/v2/account/api-keys')
-        data = response.json()
+        data = parse_json(response)
         return data['api_keys']
     
     def create_api_key(
@@ -98,7 +142,7 @@ class AccountService:
             data['expires_at'] = expires_at
         
         response = self.client.post('/api/v2/account/api-keys', data=data)
-        return response.json()
+        return parse_json(response)
     
     def delete_api_key(self, key_id: int) -> bool:
         """
@@ -111,7 +155,7 @@ class AccountService:
             True if deletion was successful
         """
         response = self.client.delete(f'/api/v2/account/api-keys/{key_id}')
-        data = response.json()
+        data = parse_json(response)
         return data.get('success', False)
     
     def get_tier_info(self) -> Dict[str, Any]:
@@ -212,4 +256,4 @@ class AccountService:
             - tier: Current subscription tier
         """
         response = self.client.get('/api/billing/wallet/info')
-        return response.json()
\ No newline at end of file
+        return parse_json(response)
\ No newline at end of file
@@ -7,6 +7,7 @@ Handles chat conversations and message management.
 from typing import List, Dict, Any, Optional, Union
 from ..models import ChatConversation, ChatMessage
 from ..exceptions import ZetsubouError
+from ..utils import parse_json, stream_to_file
 
 
 class ChatService:
@@ -36,8 +37,8 @@ class ChatService:
         }
         
         response = self.client.get('/api/v2/chat/conversations', params=params)
-        data = response.json()
-        return [ChatConversation.from_dict(conv) for conv in data['conversations']]
+        data = parse_json(response)
+        return list(map(ChatConversation.from_dict, data['conversations']))
     
     def create_conversation(
         self,
@@ -64,7 +65,7 @@ class ChatService:
             data['system_prompt'] = system_prompt
         
         response = self.client.post('/api/v2/chat/conversations', data=data)
-        result = response.json()
+        result = parse_json(response)
         return ChatConversation.from_dict(result['conversation'])
     
     def get_conversation(self, conversation_uuid: str) -> ChatConversation:
@@ -78,7 +79,7 @@ class ChatService:
             ChatConversation object
         """
         response = self.client.get(f'/api/v2/chat/conversations/{conversation_uuid}')
-        data = response.json()
+        data = parse_json(response)
         return ChatConversation.from_dict(data)
     
     def delete_conversation(self, conversation_uuid: str) -> bool:
@@ -92,7 +93,7 @@ class ChatService:
             True if deletion was successful
         """
         response = self.client.delete(f'/api/v2/chat/conversations/{conversation_uuid}')
-        data = response.json()
+        data = parse_json(response)
         return data.get('success', False)
     
     def get_messages(self, conversation_uuid: str) -> List[ChatMessage]:
@@ -106,8 +107,8 @@ class ChatService:
             List of ChatMessage objects
         """
         response = self.client.get(f'/api/v2/chat/conversations/{conversation_uuid}/messages')
-        data = response.json()
-        return [ChatMessage.from_dict(msg) for msg in data['messages']]
+        data = parse_json(response)
+        return list(map(ChatMessage.from_dict, data['messages']))
     
     def send_message(
         self,
@@ -130,7 +131,7 @@ class ChatService:
             f'/api/v2/chat/conversations/{conversation_uuid}/messages',
             data=data
         )
-        result = response.json()
+        result = parse_json(response)
         return ChatMessage.from_dict(result['message'])
     
     def export_conversation(
@@ -158,23 +159,15 @@ class ChatService:
         )
         
         if format == 'json':
-            return response.json()
+            return parse_json(response)
         elif format == 'md':
             return response.text
-        elif format == 'html':
-            content = response.text
+        elif format in ('html', 'pdf'):
+            # Write straight from the socket rather than holding the whole
+            # export in memory first
             if output_path:
-                with open(output_path, 'w', encoding='utf-8') as f:
-                    f.write(content)
-                return output_path
-            return content
-        elif format == 'pdf':
-            content = response.content
-            if output_path:
-                with open(output_path, 'wb') as f:
-                    f.write(content)
-                return output_path
-            return content
+                return stream_to_file(response, output_path)
+            return response.text if format == 'html' else response.content
         else:
             raise ValueError(f"Unsupported export format: {format}. Use 'json', 'md', 'html', or 'pdf'")
     
@@ -6,6 +6,7 @@ Handles GraphQL queries and mutations.
 
 from typing import Dict, Any, Optional
 from ..exceptions import ZetsubouError
+from ..utils import dumps_json, parse_json
 
 
 class GraphQLService:
@@ -43,13 +44,16 @@ class GraphQLService:
         if operation_name:
             payload['operationName'] = operation_name
         
-        response = self.client.post('/api/graphql', data=payload)
-        data = response.json()
+        # Encoded here so large variable sets go through orjson when installed
+        response = self.client.post('/api/graphql', data=dumps_json(payload))
+        data = parse_json(response)
         
         # Check for GraphQL errors
-        if 'errors' in data and data['errors']:
-            error_messages = [e.get('message', 'Unknown error') for e in data['errors']]
-            raise ZetsubouError(f"GraphQL errors: {'; '.join(error_messages)}")
+        errors = data.get('errors')
+        if errors:
+            raise ZetsubouError(
+                "GraphQL errors: " + '; '.join(e.get('message', 'Unknown error') for e in errors)
+            )
         
         return data
     
@@ -4,9 +4,57 @@ Jobs Service
 Handles job management, status checking, and result retrieval.
 """
 
-from typing import List, Dict, Any, Optional, BinaryIO, Union
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Any, Optional, BinaryIO, Iterator, Tuple, Union
+from .._errors import is_unsupported, retry_after_seconds
 from ..models import Job
-from ..exceptions import ZetsubouError
+from ..exceptions import ZetsubouError, AuthenticationError, NotFoundError, RateLimitError
+from ..utils import DOWNLOAD_CHUNK_SIZE, loads_json, parse_json, stream_to_file, stream_to_fileobj
+from ._cache import MAX_ENTRIES, cached, invalidate, prime
+
+_SSE_HEADERS = {'Accept': 'text/event-stream'}
+
+
+def _is_finished(job: Job, job_id: str) -> bool:
+    """Return True if the job completed; raise if it failed or was cancelled."""
+    if job.status == 'completed':
+        return True
+    elif job.status == 'failed':
+        raise ZetsubouError(f"Job {job_id} failed: {job.error}")
+    elif job.status == 'cancelled':
+        raise ZetsubouError(f"Job {job_id} was cancelled")
+    return False
+
+
+class _PollBackoff:
+    """
+    Delay schedule for job polling.
+    
+    Starts at ``poll_interval`` and grows 1.5x per poll (plus up to 10%
+    jitter) to at most ``max_interval``, resetting whenever the job's
+    progress changes. A server ``Retry-After`` hint overrides the schedule.
+    """
+    
+    def __init__(self, poll_interval: float, max_interval: float):
+        self.poll_interval = poll_interval
+        self.max_interval = max_interval
+        self.attempt = 0
+        self.last_progress = None
+    
+    def next_interval(self, job: Job, retry_after: Optional[float]) -> float:
+        if job.progress != self.last_progress:
+            self.last_progress = job.progress
+            self.attempt = 0
+        
+        if retry_after is not None:
+            interval = retry_after
+        else:
+            interval = min(self.max_interval, self.poll_interval * 1.5 ** self.attempt)
+            interval += random.uniform(0, interval * 0.1)
+        self.attempt += 1
+        return interval
 
 
 class JobsService:
@@ -14,6 +62,13 @@ class JobsService:
     
     def __init__(self, client):
         self.client = client
+        # None until the job event stream has been tried; False once the
+        # server has shown it does not provide one
+        self._sse_supported = None
+        # False once the batch lookup endpoint has returned 404
+        self._batch_supported = True
+        # job_id -> (ETag, Job) for conditional re-fetches
+        self._etags: Dict[str, Tuple[str, Job]] = {}
     
     def list(
         self,
@@ -44,36 +99,148 @@ class JobsService:
             params['tool_id'] = tool_id
         
         response = self.client.get('/api/v2/jobs', params=params)
-        data = response.json()
+        data = parse_json(response)
         return [Job.from_dict(job) for job in data['jobs']]
     
+    def iter_jobs(
+        self,
+        status: Optional[str] = None,
+        tool_id: Optional[str] = None,
+        page_size: int = 200
+    ) -> Iterator[Job]:
+        """
+        Iterate over all jobs, fetching pages as needed.
+        
+        The next page is requested in the background while the current page
+        is being consumed.
+        
+        Args:
+            status: Filter by job status (pending, running, completed, failed, cancelled)
+            tool_id: Filter by tool ID
+            page_size: Number of jobs requested per page
+            
+        Yields:
+            Job objects
+        """
+        # Build the shared session before the prefetch thread needs it
+        self.client.session
+        
+        executor = ThreadPoolExecutor(max_workers=1)
+        try:
+            offset = 0
+            future = executor.submit(self.list, status, tool_id, page_size, offset)
+            while True:
+                page = future.result()
+                if len(page) < page_size:
+                    yield from page
+                    return
+                offset += len(page)
+                future = executor.submit(self.list, status, tool_id, page_size, offset)
+                yield from page
+        finally:
+            # Don't block an early-exiting caller on an in-flight prefetch
+            executor.shutdown(wait=False)
+    
+    @cached('short')
     def get(self, job_id: str) -> Job:
         """
         Get details for a specific job.
         
+        Cached for 5 seconds, so a status change can take that long to
+        show; pass ``use_cache=False`` to force a fresh fetch.
+        
         Args:
             job_id: Job identifier
             
         Returns:
             Job object
         """
-        response = self.client.get(f'/api/v2/jobs/{job_id}')
-        data = response.json()
-        return Job.from_dict(data['job'])
+        return self._get_with_meta(job_id)[0]
+    
+    def get_many(self, job_ids: List[str]) -> List[Job]:
+        """
+        Get details for several jobs in one request.
+        
+        Falls back to concurrent single-job lookups if the server does not
+        provide the batch endpoint.
+        
+        Args:
+            job_ids: Job identifiers
+            
+        Returns:
+            Job objects in the order of ``job_ids`` (unknown IDs are skipped
+            by the batch endpoint)
+        """
+        if not job_ids:
+            return []
+        
+        if self._batch_supported:
+            try:
+                response = self.client.post('/api/v2/jobs:batchGet', data={'ids': list(job_ids)})
+            except ZetsubouError as e:
+                if not is_unsupported(e):
+                    raise
+                self._batch_supported = False
+            else:
+                data = parse_json(response)
+                by_id = {job.id: job for job in map(Job.from_dict, data['jobs'])}
+                return [by_id[job_id] for job_id in job_ids if job_id in by_id]
+        
+        # Build the shared session before the worker threads need it
+        self.client.session
+        with ThreadPoolExecutor(max_workers=min(8, len(job_ids))) as executor:
+            return list(executor.map(self.get, job_ids))
+    
+    def _get_with_meta(self, job_id: str) -> Tuple[Job, Optional[float]]:
+        """
+        Fetch a job along with the server's ``Retry-After`` poll hint in seconds, if any.
+        
+        Re-fetches are conditional (``If-None-Match``) when the server sent an
+        ETag, so an unchanged job costs a bodiless 304. Every fetch refreshes
+        the :meth:`get` cache, so polling and ``get``/``get_progress`` calls
+        share requests.
+        """
+        known = self._etags.get(job_id)
+        headers = {'If-None-Match': known[0]} if known else None
+        response = self.client.get(f'/api/v2/jobs/{job_id}', headers=headers)
+        
+        if response.status_code == 304 and known:
+            job = known[1]
+        else:
+            data = parse_json(response)
+            job = Job.from_dict(data['job'])
+            etag = response.headers.get('ETag')
+            self._etags.pop(job_id, None)
+            if etag:
+                self._etags[job_id] = (etag, job)
+                if len(self._etags) > MAX_ENTRIES:
+                    self._etags.pop(next(iter(self._etags)), None)
+        
+        prime(self, 'get', (job_id,), job)
+        return job, retry_after_seconds(response.headers)
     
     def wait_for_completion(
         self,
         job_id: str,
         timeout: int = 3600,
-        poll_interval: int = 5
+        poll_interval: int = 5,
+        max_interval: int = 60
     ) -> Job:
         """
-        Wait for a job to complete with polling.
+        Wait for a job to complete.
+        
+        Follows the job's event stream when the server provides one (see
+        :meth:`stream_until_complete`), otherwise polls. The delay between
+        polls starts at ``poll_interval`` and grows 1.5x per poll (plus up to
+        10% jitter) to at most ``max_interval``. It drops back to
+        ``poll_interval`` whenever the job's progress changes, and a
+        ``Retry-After`` header on the job response overrides it.
         
         Args:
             job_id: Job identifier
             timeout: Maximum time to wait in seconds
-            poll_interval: Time between polls in seconds
+            poll_interval: Initial time between polls in seconds
+            max_interval: Maximum time between polls in seconds
             
         Returns:
             Completed Job object
@@ -81,24 +248,123 @@ class JobsService:
         Raises:
             ZetsubouError: If job fails or times out
         """
-        import time
+        job = None
+        for job in self.stream_until_complete(job_id, timeout, poll_interval, max_interval):
+            pass
+        return job
+    
+    def stream_until_complete(
+        self,
+        job_id: str,
+        timeout: int = 3600,
+        poll_interval: int = 5,
+        max_interval: int = 60
+    ) -> Iterator[Job]:
+        """
+        Yield job updates until the job completes.
         
-        start_time = time.time()
+        Listens on the job's server-sent event stream
+        (``/api/v2/jobs/{job_id}/events``) so updates arrive as they happen
+        without sleeping. If the server has no event stream, or the stream
+        drops, falls back to polling with the backoff described in
+        :meth:`wait_for_completion`.
         
-        while time.time() - start_time < timeout:
-            job = self.get(job_id)
+        Args:
+            job_id: Job identifier
+            timeout: Maximum time to wait in seconds
+            poll_interval: Initial time between polls in seconds
+            max_interval: Maximum time between polls in seconds
             
-            if job.status == 'completed':
-                return job
-            elif job.status == 'failed':
-                raise ZetsubouError(f"Job {job_id} failed: {job.error}")
-            elif job.status == 'cancelled':
-                raise ZetsubouError(f"Job {job_id} was cancelled")
+        Yields:
+            Job objects, the last one completed
+            
+        Raises:
+            ZetsubouError: If job fails or times out
+        """
+        deadline = time.monotonic() + timeout
+        
+        if self._sse_supported is not False:
+            for job in self._iter_events(job_id, deadline):
+                yield job
+                if _is_finished(job, job_id):
+                    return
+        
+        backoff = _PollBackoff(poll_interval, max_interval)
+        while True:
+            job, retry_after = self._get_with_meta(job_id)
+            yield job
+            if _is_finished(job, job_id):
+                return
             
-            time.sleep(poll_interval)
+            interval = backoff.next_interval(job, retry_after)
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            time.sleep(min(interval, remaining))
         
         raise ZetsubouError(f"Job {job_id} timed out after {timeout} seconds")
     
+    def _iter_events(self, job_id: str, deadline: float) -> Iterator[Job]:
+        """Yield Jobs from the job's SSE stream until it ends, fails or ``deadline`` passes."""
+        # Bound each socket read by the time left, so an idle stream cannot
+        # block past the deadline
+        read_timeout = max(min(self.client.timeout, deadline - time.monotonic()), 0.1)
+        try:
+            response = self.client.get(
+                f'/api/v2/jobs/{job_id}/events',
+                stream=True,
+                headers=_SSE_HEADERS,
+                timeout=(self.client.timeout, read_timeout)
+            )
+        except (AuthenticationError, RateLimitError):
+            raise
+        except NotFoundError:
+            # No event stream on this server; poll from now on
+            self._sse_supported = False
+            return
+        except ZetsubouError:
+            # e.g. 415 or a transport error; poll this time
+            return
+        
+        try:
+            if not response.headers.get('Content-Type', '').startswith('text/event-stream'):
+                self._sse_supported = False
+                return
+            self._sse_supported = True
+            
+            # Bytes lines: requests would decode text/* without a charset as
+            # latin-1. chunk_size=None yields events as soon as they arrive.
+            data_lines = []
+            for line in response.iter_lines(chunk_size=None):
+                # Checked on every line: keep-alives and non-job events must
+                # not extend the wait either
+                if time.monotonic() >= deadline:
+                    return
+                if line:
+                    if line.startswith(b'data:'):
+                        data_lines.append(line[6:] if line[5:6] == b' ' else line[5:])
+                    continue
+                if not data_lines:
+                    continue
+                
+                # A blank line ends the event
+                payload = b'\n'.join(data_lines)
+                data_lines = []
+                try:
+                    data = loads_json(payload)
+                    job = Job.from_dict(data.get('job', data))
+                except (ValueError, KeyError, AttributeError):
+                    # Keep-alive or non-job event
+                    continue
+                yield job
+                if time.monotonic() >= deadline:
+                    return
+        except OSError:
+            # Stream dropped (requests exceptions are OSErrors); poll instead
+            return
+        finally:
+            response.close()
+    
     def cancel(self, job_id: str) -> bool:
         """
         Cancel a running job.
@@ -110,7 +376,9 @@ class JobsService:
             True if cancellation was successful
         """
         response = self.client.post(f'/api/v2/jobs/{job_id}/cancel')
-        data = response.json()
+        data = parse_json(response)
+        invalidate(self)
+        self._etags.pop(job_id, None)
         return data.get('success', False)
     
     def retry(self, job_id: str) -> Job:
@@ -124,7 +392,9 @@ class JobsService:
             New Job object
         """
         response = self.client.post(f'/api/v2/jobs/{job_id}/retry')
-        data = response.json()
+        data = parse_json(response)
+        invalidate(self)
+        self._etags.pop(job_id, None)
         return Job.from_dict(data['job'])
     
     def delete(self, job_id: str) -> bool:
@@ -138,41 +408,58 @@ class JobsService:
             True if deletion was successful
         """
         response = self.client.delete(f'/api/v2/jobs/{job_id}')
-        data = response.json()
+        data = parse_json(response)
+        invalidate(self)
+        self._etags.pop(job_id, None)
         return data.get('success', False)
     
-    def download_results(self, job_id: str, output_path: Optional[str] = None) -> Union[bytes, str]:
+    def download_results(
+        self,
+        job_id: str,
+        output_path: Optional[str] = None,
+        output_stream: Optional[BinaryIO] = None,
+        chunk_size: int = DOWNLOAD_CHUNK_SIZE
+    ) -> Union[bytes, str, BinaryIO]:
         """
         Download job results as a ZIP file.
         
+        With ``output_path`` or ``output_stream`` the archive is copied
+        straight from the connection in ``chunk_size`` blocks and never held
+        in memory as a whole.
+        
         Args:
             job_id: Job identifier
             output_path: Optional path to save the file
+            output_stream: Optional writable binary file object (e.g. an open
+                file, a hash wrapper or an upload stream) to copy into
+            chunk_size: Copy buffer size in bytes (default: 1 MiB)
             
         Returns:
-            File content as bytes if no output_path, otherwise the saved file path
+            The saved file path with ``output_path``, ``output_stream`` itself
+            with ``output_stream``, otherwise the file content as bytes
         """
         response = self.client.get(f'/api/v2/jobs/{job_id}/download', stream=True)
         
+        if output_stream is not None:
+            stream_to_fileobj(response, output_stream, chunk_size)
+            return output_stream
         if output_path:
-            with open(output_path, 'wb') as f:
-                for chunk in response.iter_content(chunk_size=8192):
-                    f.write(chunk)
-            return output_path
-        else:
-            return response.content
+            return stream_to_file(response, output_path, chunk_size)
+        return response.content
     
-    def get_progress(self, job_id: str) -> Dict[str, Any]:
+    def get_progress(self, job_id: str, use_cache: bool = True) -> Dict[str, Any]:
         """
         Get job progress information.
         
         Args:
             job_id: Job identifier
+            use_cache: Whether a job fetched within the last few seconds may
+                be reused
             
         Returns:
             Progress information
         """
-        job = self.get(job_id)
+        job = self.get(job_id, use_cache=use_cache)
         return {
             'status': job.status,
             'progress': job.progress,
@@ -180,4 +467,121 @@ class JobsService:
             'created_at': job.created_at,
             'updated_at': job.updated_at,
             'completed_at': job.completed_at
-        }
\ No newline at end of file
+        }
+
+
+class AsyncJobsService:
+    """
+    Async counterpart of :class:`JobsService` for :class:`~zetsubou.AsyncZetsubouClient`.
+    
+    Waiting uses ``asyncio.sleep``, so many jobs can be polled concurrently
+    from one event loop (see :meth:`wait_for_many`).
+    """
+    
+    def __init__(self, client):
+        self.client = client
+    
+    async def get(self, job_id: str) -> Job:
+        """
+        Get details for a specific job.
+        
+        Args:
+            job_id: Job identifier
+            
+        Returns:
+            Job object
+        """
+        return (await self._get_with_meta(job_id))[0]
+    
+    async def _get_with_meta(self, job_id: str) -> Tuple[Job, Optional[float]]:
+        """Fetch a job along with the server's ``Retry-After`` poll hint in seconds, if any."""
+        response = await self.client.get(f'/api/v2/jobs/{job_id}')
+        data = parse_json(response)
+        return Job.from_dict(data['job']), retry_after_seconds(response.headers)
+    
+    async def wait_for_completion(
+        self,
+        job_id: str,
+        timeout: int = 3600,
+        poll_interval: int = 5,
+        max_interval: int = 60
+    ) -> Job:
+        """
+        Wait for a job to complete with polling.
+        
+        Same backoff schedule as :meth:`JobsService.wait_for_completion`, but
+        sleeping with ``asyncio.sleep`` so other tasks keep running.
+        
+        Args:
+            job_id: Job identifier
+            timeout: Maximum time to wait in seconds
+            poll_interval: Initial time between polls in seconds
+            max_interval: Maximum time between polls in seconds
+            
+        Returns:
+            Completed Job object
+            
+        Raises:
+            ZetsubouError: If job fails or times out
+        """
+        import asyncio
+        
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        backoff = _PollBackoff(poll_interval, max_interval)
+        
+        while True:
+            job, retry_after = await self._get_with_meta(job_id)
+            if _is_finished(job, job_id):
+                return job
+            
+            interval = backoff.next_interval(job, retry_after)
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                break
+            await asyncio.sleep(min(interval, remaining))
+        
+        raise ZetsubouError(f"Job {job_id} timed out after {timeout} seconds")
+    
+    async def wait_for_many(
+        self,
+        job_ids: List[str],
+        timeout: int = 3600,
+        poll_interval: int = 5,
+        max_interval: int = 60
+    ) -> List[Job]:
+        """
+        Wait for several jobs concurrently.
+        
+        Args:
+            job_ids: Job identifiers
+            timeout: Maximum time to wait for each job in seconds
+            poll_interval: Initial time between polls in seconds
+            max_interval: Maximum time between polls in seconds
+            
+        Returns:
+            Completed Job objects, in the order of ``job_ids``
+            
+        Raises:
+            ZetsubouError: If any job fails or times out
+        """
+        import asyncio
+        
+        return list(await asyncio.gather(*[
+            self.wait_for_completion(job_id, timeout, poll_interval, max_interval)
+            for job_id in job_ids
+        ]))
+    
+    async def cancel(self, job_id: str) -> bool:
+        """
+        Cancel a running job.
+        
+        Args:
+            job_id: Job identifier
+            
+        Returns:
+            True if cancellation was successful
+        """
+        response = await self.client.post(f'/api/v2/jobs/{job_id}/cancel')
+        data = parse_json(response)
+        return data.get('success', False)
@@ -4,13 +4,31 @@ NFT Service
 Handles NFT project, layer, trait, and generation management.
 """
 
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from typing import List, Dict, Any, Optional
+from .._errors import is_unsupported
 from ..exceptions import ZetsubouError
+from ..utils import parse_json
+from ._cache import cached, invalidate
+
+
+def _unwrap(data: Dict[str, Any], action: str) -> Dict[str, Any]:
+    """Return an NFT API response body, raising its error if it did not succeed."""
+    if not data.get('success'):
+        raise ZetsubouError(data.get('error') or f'Failed to {action}')
+    return data
 
 
 class NFTProject:
     """NFT Project model"""
     
+    __slots__ = (
+        'id', 'name', 'description', 'collection_config', 'generation_config',
+        'created_at', 'updated_at', 'is_archived', 'thumbnail_url', 'layers',
+        'layer_count', 'generations', 'generation_count'
+    )
+    
     def __init__(self, data: Dict[str, Any]):
         self.id = data.get('id')
         self.name = data.get('name')
@@ -33,26 +51,18 @@ class NFTProject:
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary"""
-        return {
-            'id': self.id,
-            'name': self.name,
-            'description': self.description,
-            'collection_config': self.collection_config,
-            'generation_config': self.generation_config,
-            'created_at': self.created_at,
-            'updated_at': self.updated_at,
-            'is_archived': self.is_archived,
-            'thumbnail_url': self.thumbnail_url,
-            'layers': self.layers,
-            'layer_count': self.layer_count,
-            'generations': self.generations,
-            'generation_count': self.generation_count
-        }
+        return {name: getattr(self, name) for name in self.__slots__}
 
 
 class NFTGeneration:
     """NFT Generation model"""
     
+    __slots__ = (
+        'id', 'project_id', 'total_pieces', 'status', 'created_at', 'started_at',
+        'completed_at', 'error_message', 'vfs_build_folder_id',
+        'vfs_images_folder_id', 'vfs_metadata_folder_id'
+    )
+    
     def __init__(self, data: Dict[str, Any]):
         self.id = data.get('id')
         self.project_id = data.get('project_id')
@@ -73,19 +83,15 @@ class NFTGeneration:
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary"""
-        return {
-            'id': self.id,
-            'project_id': self.project_id,
-            'total_pieces': self.total_pieces,
-            'status': self.status,
-            'created_at': self.created_at,
-            'started_at': self.started_at,
-            'completed_at': self.completed_at,
-            'error_message': self.error_message,
-            'vfs_build_folder_id': self.vfs_build_folder_id,
-            'vfs_images_folder_id': self.vfs_images_folder_id,
-            'vfs_metadata_folder_id': self.vfs_metadata_folder_id
-        }
+        return {name: getattr(self, name) for name in self.__slots__}
+
+
+@dataclass
+class NFTProjectBundle:
+    """An NFT project together with its layers and generations."""
+    project: NFTProject
+    layers: List[Dict[str, Any]]
+    generations: List[NFTGeneration]
 
 
 class NFTService:
@@ -93,11 +99,16 @@ class NFTService:
     
     def __init__(self, client):
         self.client = client
+        # False once the batch lookup endpoint has returned 404
+        self._batch_supported = True
     
+    @cached('normal')
     def list_projects(self, include_archived: bool = False) -> List[NFTProject]:
         """
         List all NFT projects.
         
+        Cached for 30 seconds; pass ``use_cache=False`` to force a fresh fetch.
+        
         Args:
             include_archived: Whether to include archived projects
             
@@ -106,15 +117,16 @@ class NFTService:
         """
         params = {'include_archived': 'true' if include_archived else 'false'}
         response = self.client.get('/api/v2/nft/projects', params=params)
-        data = response.json()
-        if not data.get('success'):
-            raise ZetsubouError(data.get('error', 'Failed to list projects'))
+        data = _unwrap(parse_json(response), 'list projects')
         return [NFTProject.from_dict(p) for p in data.get('projects', [])]
     
+    @cached('normal')
     def get_project(self, project_id: str) -> NFTProject:
         """
         Get details for a specific NFT project.
         
+        Cached for 30 seconds; pass ``use_cache=False`` to force a fresh fetch.
+        
         Args:
             project_id: Project identifier
             
@@ -122,11 +134,65 @@ class NFTService:
             NFTProject object
         """
         response = self.client.get(f'/api/v2/nft/projects/{project_id}')
-        data = response.json()
-        if not data.get('success'):
-            raise ZetsubouError(data.get('error', 'Failed to get project'))
+        data = _unwrap(parse_json(response), 'get project')
         return NFTProject.from_dict(data['project'])
     
+    def get_projects(self, project_ids: List[str]) -> List[NFTProject]:
+        """
+        Get details for several NFT projects in one request.
+        
+        Falls back to concurrent single-project lookups if the server does
+        not provide the batch endpoint.
+        
+        Args:
+            project_ids: Project identifiers
+            
+        Returns:
+            NFTProject objects in the order of ``project_ids`` (unknown IDs
+            are skipped by the batch endpoint)
+        """
+        if not project_ids:
+            return []
+        
+        if self._batch_supported:
+            try:
+                response = self.client.post('/api/v2/nft/projects:batchGet', data={'ids': list(project_ids)})
+            except ZetsubouError as e:
+                if not is_unsupported(e):
+                    raise
+                self._batch_supported = False
+            else:
+                data = _unwrap(parse_json(response), 'get projects')
+                by_id = {p.id: p for p in map(NFTProject.from_dict, data.get('projects', []))}
+                return [by_id[pid] for pid in project_ids if pid in by_id]
+        
+        # Build the shared session before the worker threads need it
+        self.client.session
+        with ThreadPoolExecutor(max_workers=min(8, len(project_ids))) as executor:
+            return list(executor.map(self.get_project, project_ids))
+    
+    def get_project_bundle(self, project_id: str) -> NFTProjectBundle:
+        """
+        Get a project, its layers and its generations in one call.
+        
+        The three requests are independent, so they are issued concurrently
+        and the call takes roughly as long as the slowest one.
+        
+        Args:
+            project_id: Project identifier
+            
+        Returns:
+            NFTProjectBundle with project, layers and generations
+        """
+        # Build the shared session before the worker threads need it
+        self.client.session
+        
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            project = executor.submit(self.get_project, project_id)
+            layers = executor.submit(self.list_layers, project_id)
+            generations = executor.submit(self.list_generations, project_id)
+            return NFTProjectBundle(project.result(), layers.result(), generations.result())
+    
     def create_project(
         self,
         name: str,
@@ -160,9 +226,8 @@ class NFTService:
             payload['layers'] = layers
         
         response = self.client.post('/api/v2/nft/projects', data=payload)
-        data = response.json()
-        if not data.get('success'):
-            raise ZetsubouError(data.get('error', 'Failed to create project'))
+        data = _unwrap(parse_json(response), 'create project')
+        invalidate(self)
         return NFTProject.from_dict(data['project'])
     
     def update_project(
@@ -201,9 +266,8 @@ class NFTService:
             payload['is_archived'] = is_archived
         
         response = self.client.patch(f'/api/v2/nft/projects/{project_id}', data=payload)
-        data = response.json()
-        if not data.get('success'):
-            raise ZetsubouError(data.get('error', 'Failed to update project'))
+        data = _unwrap(parse_json(response), 'update project')
+        invalidate(self)
         return NFTProject.from_dict(data['project'])
     
     def delete_project(self, project_id: str, permanent: bool = False) -> bool:
@@ -219,15 +283,17 @@ class NFTService:
         """
         params = {'permanent': 'true' if permanent else 'false'}
         response = self.client._make_request('DELETE', f'/api/v2/nft/projects/{project_id}', params=params)
-        data = response.json()
-        if not data.get('success'):
-            raise ZetsubouError(data.get('error', 'Failed to delete project'))
+        _unwrap(parse_json(response), 'delete project')
+        invalidate(self)
         return True
     
+    @cached('normal')
     def list_layers(self, project_id: str, include_traits: bool = True) -> List[Dict[str, Any]]:
         """
         List layers for an NFT project.
         
+        Cached for 30 seconds; pass ``use_cache=False`` to force a fresh fetch.
+        
         Args:
             project_id: Project identifier
             include_traits: Whether to include traits in response
@@ -237,9 +303,7 @@ class NFTService:
         """
         params = {'include_traits': 'true' if include_traits else 'false'}
         response = self.client.get(f'/api/v2/nft/projects/{project_id}/layers', params=params)
-        data = response.json()
-        if not data.get('success'):
-            raise ZetsubouError(data.get('error', 'Failed to list layers'))
+        data = _unwrap(parse_json(response), 'list layers')
         return data.get('layers', [])
     
     def create_layer(
@@ -275,9 +339,8 @@ class NFTService:
             payload['order_index'] = order_index
         
         response = self.client.post(f'/api/v2/nft/projects/{project_id}/layers', data=payload)
-        data = response.json()
-        if not data.get('success'):
-            raise ZetsubouError(data.get('error', 'Failed to create layer'))
+        data = _unwrap(parse_json(response), 'create layer')
+        invalidate(self)
         return data.get('layer', {})
     
     def create_generation(
@@ -302,9 +365,8 @@ class NFTService:
             payload['config_overrides'] = config_overrides
         
         response = self.client.post(f'/api/v2/nft/projects/{project_id}/generate', data=payload)
-        data = response.json()
-        if not data.get('success'):
-            raise ZetsubouError(data.get('error', 'Failed to create generation'))
+        data = _unwrap(parse_json(response), 'create generation')
+        invalidate(self)
         return NFTGeneration.from_dict(data['generation'])
     
     def get_generation(self, generation_id: str) -> NFTGeneration:
@@ -318,9 +380,7 @@ class NFTService:
             NFTGeneration object
         """
         response = self.client.get(f'/api/v2/nft/generations/{generation_id}')
-        data = response.json()
-        if not data.get('success'):
-            raise ZetsubouError(data.get('error', 'Failed to get generation'))
+        data = _unwrap(parse_json(response), 'get generation')
         return NFTGeneration.from_dict(data['generation'])
     
     def list_generations(self, project_id: str) -> List[NFTGeneration]:
@@ -334,22 +394,21 @@ class NFTService:
             List of NFTGeneration objects
         """
         response = self.client.get(f'/api/v2/nft/projects/{project_id}/generations')
-        data = response.json()
-        if not data.get('success'):
-            raise ZetsubouError(data.get('error', 'Failed to list generations'))
+        data = _unwrap(parse_json(response), 'list generations')
         return [NFTGeneration.from_dict(g) for g in data.get('generations', [])]
     
+    @cached('long')
     def get_limits(self) -> Dict[str, Any]:
         """
         Get user's NFT tier and limits.
         
+        Cached for 60 seconds; pass ``use_cache=False`` to force a fresh fetch.
+        
         Returns:
             Dictionary with tier, limits, and usage information
         """
         response = self.client.get('/api/v2/nft/limits')
-        data = response.json()
-        if not data.get('success'):
-            raise ZetsubouError(data.get('error', 'Failed to get limits'))
+        data = _unwrap(parse_json(response), 'get limits')
         return {
             'tier': data.get('tier'),
             'limits': data.get('limits', {}),
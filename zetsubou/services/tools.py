@@ -4,9 +4,38 @@ Tools Service
 Handles tool execution, listing, and management.
 """
 
+import mimetypes
+import os
 from typing import List, Dict, Any, Optional, Union, BinaryIO
 from ..models import Tool, Job
 from ..exceptions import ZetsubouError
+from ..utils import dumps_json, parse_json
+
+
+def _upload_fields(
+    files: List[Union[str, os.PathLike, BinaryIO]],
+    audio_files: Optional[List[Union[str, os.PathLike, BinaryIO]]],
+    opened: List[BinaryIO]
+) -> Dict[str, Any]:
+    """
+    Build the multipart file fields for a tool execution.
+    
+    Paths are opened (and appended to ``opened`` for the caller to close)
+    rather than read, so uploads stream from disk.
+    """
+    file_data = {}
+    for prefix, items in (('file', files), ('audio', audio_files or ())):
+        for i, file in enumerate(items):
+            if isinstance(file, (str, os.PathLike)):
+                # File path
+                fh = open(file, 'rb')
+                opened.append(fh)
+                content_type = mimetypes.guess_type(file)[0] or 'application/octet-stream'
+                file_data[f'{prefix}_{i}'] = (os.path.basename(file), fh, content_type)
+            else:
+                # File-like object
+                file_data[f'{prefix}_{i}'] = file
+    return file_data
 
 
 class ToolsService:
@@ -23,7 +52,7 @@ class ToolsService:
             List of Tool objects
         """
         response = self.client.get('/api/v2/tools')
-        data = response.json()
+        data = parse_json(response)
         return [Tool.from_dict(tool) for tool in data['tools']]
     
     def get(self, tool_id: str) -> Tool:
@@ -37,7 +66,7 @@ class ToolsService:
             Tool object
         """
         response = self.client.get(f'/api/v2/tools/{tool_id}')
-        data = response.json()
+        data = parse_json(response)
         return Tool.from_dict(data)
     
     def execute(
@@ -59,37 +88,22 @@ class ToolsService:
         Returns:
             Job object
         """
-        # Prepare files for upload
-        file_data = {}
-        for i, file in enumerate(files):
-            if isinstance(file, str):
-                # File path
-                with open(file, 'rb') as f:
-                    file_data[f'file_{i}'] = (f.name, f.read())
-            else:
-                # File-like object
-                file_data[f'file_{i}'] = file
-        
-        # Add audio files if provided
-        if audio_files:
-            for i, audio_file in enumerate(audio_files):
-                if isinstance(audio_file, str):
-                    with open(audio_file, 'rb') as f:
-                        file_data[f'audio_{i}'] = (f.name, f.read())
-                else:
-                    file_data[f'audio_{i}'] = audio_file
-        
         # Add options as form data
         form_data = {}
         if options:
-            form_data['options'] = str(options)  # Convert to string for form data
+            form_data['options'] = dumps_json(options, default=str).decode('utf-8')
         
-        response = self.client.post(
-            f'/api/v2/tools/{tool_id}/execute',
-            files=file_data,
-            data=form_data
-        )
-        data = response.json()
+        opened = []
+        try:
+            response = self.client.post(
+                f'/api/v2/tools/{tool_id}/execute',
+                files=_upload_fields(files, audio_files, opened),
+                data=form_data
+            )
+        finally:
+            for fh in opened:
+                fh.close()
+        data = parse_json(response)
         return Job.from_dict(data['job'])
     
     def batch_execute(
@@ -111,35 +125,22 @@ class ToolsService:
         Returns:
             Job object
         """
-        # Prepare files for upload
-        file_data = {}
-        for i, file in enumerate(files):
-            if isinstance(file, str):
-                with open(file, 'rb') as f:
-                    file_data[f'file_{i}'] = (f.name, f.read())
-            else:
-                file_data[f'file_{i}'] = file
-        
-        # Add audio files if provided
-        if audio_files:
-            for i, audio_file in enumerate(audio_files):
-                if isinstance(audio_file, str):
-                    with open(audio_file, 'rb') as f:
-                        file_data[f'audio_{i}'] = (f.name, f.read())
-                else:
-                    file_data[f'audio_{i}'] = audio_file
-        
         # Add options as form data
         form_data = {}
         if options:
-            form_data['options'] = str(options)
+            form_data['options'] = dumps_json(options, default=str).decode('utf-8')
         
-        response = self.client.post(
-            f'/api/v2/tools/{tool_id}/batch',
-            files=file_data,
-            data=form_data
-        )
-        data = response.json()
+        opened = []
+        try:
+            response = self.client.post(
+                f'/api/v2/tools/{tool_id}/batch',
+                files=_upload_fields(files, audio_files, opened),
+                data=form_data
+            )
+        finally:
+            for fh in opened:
+                fh.close()
+        data = parse_json(response)
         return Job.from_dict(data['job'])
     
     def create_chain(
@@ -167,7 +168,7 @@ class ToolsService:
             data['description'] = description
         
         response = self.client.post('/api/v2/chains', data=data)
-        return response.json()
+        return parse_json(response)
     
     def list_chains(self) -> List[Dict[str, Any]]:
         """
@@ -177,7 +178,7 @@ class ToolsService:
             List of chain information
         """
         response = self.client.get('/api/v2/chains')
-        data = response.json()
+        data = parse_json(response)
         return data['chains']
     
     def get_chain(self, chain_id: int) -> Dict[str, Any]:
@@ -191,4 +192,4 @@ class ToolsService:
             Chain details
         """
         response = self.client.get(f'/api/v2/chains/{chain_id}')
-        return response.json()
\ No newline at end of file
+        return parse_json(response)
\ No newline at end of file
@@ -4,9 +4,79 @@ VFS Service
 Handles Virtual File System operations including file upload, download, and management.
 """
 
-from typing import List, Dict, Any, Optional, Union, BinaryIO
+import glob
+import mimetypes
+import mmap
+import os
+import shutil
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Any, Optional, Tuple, Union, BinaryIO, Iterator
+from .._errors import is_unsupported, parse_error_body, raise_for_status
 from ..models import VFSNode
-from ..exceptions import ZetsubouError
+from ..exceptions import ZetsubouError, ConnectionError as APIConnectionError
+from ..utils import DOWNLOAD_CHUNK_SIZE, parse_json, stream_to_file, stream_to_fileobj
+from ._cache import cached, invalidate, invalidate_peer
+
+# Size of each ranged request made by download_file_parallel
+DOWNLOAD_PART_SIZE = 8 * 1024 * 1024
+
+# Size of each part sent by upload_file_parallel
+UPLOAD_PART_SIZE = 8 * 1024 * 1024
+
+# Pages of file listings scanned by search_files before it gives up; the
+# filtering is client-side, so this bounds the cost of one search
+SEARCH_MAX_PAGES = 10
+
+# Part uploads go to presigned URLs: drop the session's API key and JSON
+# Content-Type (requests removes headers set to None)
+_PART_HEADERS = {'X-API-Key': None, 'Content-Type': None}
+
+
+def _range_headers(start: int, end: int) -> Dict[str, str]:
+    """Return the headers requesting bytes ``start``-``end`` of a download."""
+    # Content-Range offsets refer to the encoded body, so parts are requested
+    # uncompressed; a decoded gzip part would not match its range
+    return {'Range': f'bytes={start}-{end}', 'Accept-Encoding': 'identity'}
+
+
+def _content_range(response) -> Optional[Tuple[int, int, int]]:
+    """Return (first byte, last byte, total size) of a 206 response, or None."""
+    if response.status_code != 206:
+        return None
+    value = response.headers.get('Content-Range', '')
+    try:
+        unit, _, spec = value.partition(' ')
+        byte_range, _, total = spec.partition('/')
+        first, _, last = byte_range.partition('-')
+        if unit != 'bytes':
+            return None
+        return int(first), int(last), int(total)
+    except ValueError:
+        return None
+
+
+def _cached_downloads(cache_dir: str, node_id: str) -> List[Tuple[str, str]]:
+    """Return (path, ETag) of the cached copies of a node, newest first."""
+    entries = []
+    for path in glob.glob(os.path.join(glob.escape(cache_dir), glob.escape(node_id) + '-*')):
+        name, _, encoded = os.path.basename(path).rpartition('-')
+        if name != node_id:
+            # Another node whose ID starts with this one
+            continue
+        try:
+            etag = bytes.fromhex(encoded).decode('utf-8')
+            entries.append((os.path.getmtime(path), path, etag))
+        except (ValueError, OSError):
+            continue
+    entries.sort(reverse=True)
+    return [(path, etag) for _, path, etag in entries]
+
+
+def _write_file(path: str, content: bytes) -> str:
+    with open(path, 'wb') as f:
+        f.write(content)
+    return path
 
 
 class VFSService:
@@ -14,7 +84,10 @@ class VFSService:
     
     def __init__(self, client):
         self.client = client
+        # False once the multipart upload endpoint has returned 404
+        self._multipart_supported = True
     
+    @cached('short', stale_ttl=30)
     def list_nodes(
         self,
         parent_id: Optional[str] = None,
@@ -25,6 +98,10 @@ class VFSService:
         """
         List VFS nodes (files and folders).
         
+        Cached for 5 seconds; pass ``use_cache=False`` to force a fresh fetch.
+        For 30 seconds after that the cached listing is still returned
+        immediately while it is revalidated (with its ETag) in the background.
+        
         Args:
             parent_id: Filter by parent folder ID
             node_type: Filter by node type ('file' or 'folder')
@@ -43,82 +120,413 @@ class VFSService:
         if node_type:
             params['type'] = node_type
         
-        response = self.client.get('/api/v2/vfs/nodes', params=params)
-        data = response.json()
-        return [VFSNode.from_dict(node) for node in data['nodes']]
+        response = self.client.get('/api/v2/vfs/nodes', params=params, revalidate=True)
+        data = parse_json(response)
+        return VFSNode.from_dicts(data['nodes'])
+    
+    def iter_nodes(
+        self,
+        parent_id: Optional[str] = None,
+        node_type: Optional[str] = None,
+        page_size: int = 200
+    ) -> Iterator[VFSNode]:
+        """
+        Iterate over all VFS nodes, fetching pages as needed.
+        
+        Only one page of nodes is held at a time, and the next page is
+        requested in the background while the current page is being consumed.
+        
+        Args:
+            parent_id: Filter by parent folder ID
+            node_type: Filter by node type ('file' or 'folder')
+            page_size: Number of nodes requested per page
+            
+        Yields:
+            VFSNode objects
+        """
+        # Build the shared session before the prefetch thread needs it
+        self.client.session
+        
+        # Pages bypass the listing cache: mixing cached (possibly stale) and
+        # fresh pages in one offset walk could skip or repeat nodes
+        def fetch(offset: int) -> List[VFSNode]:
+            return self.list_nodes(parent_id, node_type, page_size, offset, use_cache=False)
+        
+        executor = ThreadPoolExecutor(max_workers=1)
+        try:
+            offset = 0
+            future = executor.submit(fetch, offset)
+            while True:
+                page = future.result()
+                if len(page) < page_size:
+                    yield from page
+                    return
+                offset += len(page)
+                future = executor.submit(fetch, offset)
+                yield from page
+        finally:
+            # Don't block an early-exiting caller on an in-flight prefetch
+            executor.shutdown(wait=False)
     
+    @cached('normal')
     def get_node(self, node_id: str) -> VFSNode:
         """
         Get details for a specific VFS node.
         
+        Cached for 30 seconds; pass ``use_cache=False`` to force a fresh fetch.
+        Once expired, the node is revalidated with its ETag.
+        
         Args:
             node_id: VFS node UUID
             
         Returns:
             VFSNode object
         """
-        response = self.client.get(f'/api/v2/vfs/nodes/{node_id}')
-        data = response.json()
+        response = self.client.get(f'/api/v2/vfs/nodes/{node_id}', revalidate=True)
+        data = parse_json(response)
         return VFSNode.from_dict(data['node'])
     
     def upload_file(
         self,
-        file: Union[str, BinaryIO],
+        file: Union[str, os.PathLike, BinaryIO],
         parent_id: Optional[str] = None,
         encrypt: bool = False
     ) -> VFSNode:
         """
         Upload a file to VFS.
         
+        The file is streamed from disk (or from the file-like object) as the
+        request is sent, so it is never read into memory as a whole.
+        
         Args:
-            file: File path or file-like object
+            file: File path (str or path-like) or file-like object
             parent_id: Optional parent folder ID
             encrypt: Whether to encrypt the file
             
         Returns:
             VFSNode object for the uploaded file
         """
-        # Prepare file for upload
-        if isinstance(file, str):
-            with open(file, 'rb') as f:
-                file_data = {'file': (f.name, f.read())}
-        else:
-            file_data = {'file': file}
-        
         # Prepare form data
         form_data = {'encrypt': str(encrypt).lower()}
         if parent_id:
             form_data['parent_id'] = parent_id
         
-        response = self.client.post(
-            '/api/v2/vfs/upload',
-            files=file_data,
-            data=form_data
-        )
-        data = response.json()
+        # Prepare file for upload; paths are opened rather than read
+        fh = None
+        if isinstance(file, (str, os.PathLike)):
+            fh = open(file, 'rb')
+            content_type = mimetypes.guess_type(file)[0] or 'application/octet-stream'
+            file_data = {'file': (os.path.basename(file), fh, content_type)}
+        else:
+            file_data = {'file': file}
+        
+        try:
+            response = self.client.post(
+                '/api/v2/vfs/upload',
+                files=file_data,
+                data=form_data
+            )
+        finally:
+            if fh is not None:
+                fh.close()
+        data = parse_json(response)
+        invalidate(self)
+        invalidate_peer(self, 'account')
+        return VFSNode.from_dict(data['node'])
+    
+    def upload_file_parallel(
+        self,
+        path: Union[str, os.PathLike],
+        parent_id: Optional[str] = None,
+        encrypt: bool = False,
+        part_size: int = UPLOAD_PART_SIZE,
+        max_workers: int = 8
+    ) -> VFSNode:
+        """
+        Upload a large file to VFS over several connections at once.
+        
+        The upload is split into ``part_size`` parts that are PUT to the
+        presigned URLs returned by the multipart upload endpoint, up to
+        ``max_workers`` at a time, straight from a memory map of the file.
+        Failed parts are retried by the client's retry policy; if the upload
+        still cannot be completed, it is aborted on the server. Files that
+        fit in one part, and servers without multipart uploads, fall back to
+        :meth:`upload_file`.
+        
+        Args:
+            path: Path of the file to upload
+            parent_id: Optional parent folder ID
+            encrypt: Whether to encrypt the file
+            part_size: Size of each part in bytes (default: 8 MiB)
+            max_workers: Maximum number of concurrent part uploads
+            
+        Returns:
+            VFSNode object for the uploaded file
+        """
+        size = os.path.getsize(path)
+        if not self._multipart_supported or size <= part_size:
+            return self.upload_file(path, parent_id=parent_id, encrypt=encrypt)
+        
+        init_data = {
+            'name': os.path.basename(path),
+            'size': size,
+            'part_size': part_size,
+            'mime_type': mimetypes.guess_type(path)[0] or 'application/octet-stream',
+            'encrypt': encrypt
+        }
+        if parent_id:
+            init_data['parent_id'] = parent_id
+        try:
+            response = self.client.post('/api/v2/vfs/upload/init', data=init_data)
+        except ZetsubouError as e:
+            if not is_unsupported(e):
+                raise
+            self._multipart_supported = False
+            return self.upload_file(path, parent_id=parent_id, encrypt=encrypt)
+        upload = parse_json(response)
+        upload_id = upload['upload_id']
+        
+        completed = False
+        try:
+            node = self._upload_parts(path, upload, part_size, max_workers)
+            completed = True
+        finally:
+            if not completed:
+                self._abort_upload(upload_id)
+        invalidate(self)
+        invalidate_peer(self, 'account')
+        return node
+    
+    def _upload_parts(
+        self,
+        path: Union[str, os.PathLike],
+        upload: Dict[str, Any],
+        part_size: int,
+        max_workers: int
+    ) -> VFSNode:
+        """PUT every part of an initiated multipart upload and complete it."""
+        import requests
+        
+        session = self.client.session
+        timeout = self.client.timeout
+        
+        with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            def put_part(part: Dict[str, Any]) -> Dict[str, Any]:
+                number = part['part_number']
+                start = (number - 1) * part_size
+                with memoryview(mm)[start:start + part_size] as body:
+                    try:
+                        result = session.put(part['url'], data=body, headers=_PART_HEADERS, timeout=timeout)
+                    except requests.exceptions.RequestException as e:
+                        raise APIConnectionError(f"Upload of part {number} failed: {str(e)}")
+                if not 200 <= result.status_code < 300:
+                    raise_for_status(
+                        result.status_code,
+                        parse_error_body(result.content, result.status_code),
+                        result.headers
+                    )
+                return {'part_number': number, 'etag': result.headers.get('ETag')}
+            
+            with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(upload['parts'])))) as executor:
+                futures = [executor.submit(put_part, part) for part in upload['parts']]
+                try:
+                    parts = [future.result() for future in futures]
+                except BaseException:
+                    # Don't start parts that are still queued
+                    for future in futures:
+                        future.cancel()
+                    raise
+        
+        upload_id = upload['upload_id']
+        response = self.client.post(f'/api/v2/vfs/upload/{upload_id}/complete', data={'parts': parts})
+        data = parse_json(response)
         return VFSNode.from_dict(data['node'])
     
-    def download_file(self, node_id: str, output_path: Optional[str] = None) -> Union[bytes, str]:
+    def _abort_upload(self, upload_id: str):
+        """Abort a multipart upload so the server can discard its parts."""
+        try:
+            self.client.delete(f'/api/v2/vfs/upload/{upload_id}')
+        except ZetsubouError:
+            # Best effort: the upload's own error is what the caller needs
+            pass
+    
+    def download_file(
+        self,
+        node_id: str,
+        output_path: Optional[str] = None,
+        chunk_size: int = DOWNLOAD_CHUNK_SIZE,
+        cache_dir: Optional[str] = None
+    ) -> Union[bytes, str]:
         """
         Download a file from VFS.
         
+        With ``output_path`` the file is copied straight from the connection
+        in ``chunk_size`` blocks and never held in memory as a whole.
+        
+        With ``cache_dir`` (e.g. ``~/.cache/zetsubou/vfs``) downloads are kept
+        on disk keyed by node ID and ETag. Later downloads of the node send
+        the cached ETag as ``If-None-Match`` and are served from disk when
+        the server answers ``304 Not Modified``. Cache entries are written to
+        a temporary file and renamed into place, so concurrent processes
+        never see partial files.
+        
         Args:
             node_id: VFS node UUID
             output_path: Optional path to save the file
+            chunk_size: Copy buffer size in bytes (default: 1 MiB; pass 8192
+                for the previous behaviour)
+            cache_dir: Optional directory for the persistent download cache
             
         Returns:
             File content as bytes if no output_path, otherwise the saved file path
         """
+        if cache_dir is not None:
+            return self._download_cached(node_id, output_path, chunk_size, os.path.expanduser(cache_dir))
+        
         response = self.client.get(f'/api/v2/vfs/nodes/{node_id}/download', stream=True)
         
         if output_path:
-            with open(output_path, 'wb') as f:
-                for chunk in response.iter_content(chunk_size=8192):
-                    f.write(chunk)
-            return output_path
+            return stream_to_file(response, output_path, chunk_size)
         else:
             return response.content
     
+    def _download_cached(
+        self,
+        node_id: str,
+        output_path: Optional[str],
+        chunk_size: int,
+        cache_dir: str
+    ) -> Union[bytes, str]:
+        """Download a file through the on-disk cache in ``cache_dir``."""
+        os.makedirs(cache_dir, exist_ok=True)
+        cached = _cached_downloads(cache_dir, node_id)
+        headers = {'If-None-Match': cached[0][1]} if cached else None
+        response = self.client.get(f'/api/v2/vfs/nodes/{node_id}/download', stream=True, headers=headers)
+        
+        if response.status_code == 304 and cached:
+            response.close()
+            path = cached[0][0]
+        else:
+            etag = response.headers.get('ETag')
+            if not etag:
+                # Nothing to revalidate against later: don't cache
+                if output_path:
+                    return stream_to_file(response, output_path, chunk_size)
+                return response.content
+            
+            path = os.path.join(cache_dir, f"{node_id}-{etag.encode('utf-8').hex()}")
+            fd, tmp_path = tempfile.mkstemp(dir=cache_dir, prefix='.download-')
+            try:
+                with os.fdopen(fd, 'wb') as f:
+                    stream_to_fileobj(response, f, chunk_size)
+                os.replace(tmp_path, path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+            
+            # Drop superseded versions of the node
+            for old_path, _ in cached:
+                if old_path != path:
+                    try:
+                        os.remove(old_path)
+                    except OSError:
+                        pass
+        
+        if output_path:
+            shutil.copyfile(path, output_path)
+            return output_path
+        with open(path, 'rb') as f:
+            return f.read()
+    
+    def download_file_parallel(
+        self,
+        node_id: str,
+        output_path: str,
+        max_workers: int = 8,
+        part_size: int = DOWNLOAD_PART_SIZE
+    ) -> str:
+        """
+        Download a large file from VFS over several connections at once.
+        
+        The file is fetched as ``part_size`` HTTP Range requests, up to
+        ``max_workers`` of them in flight, each written straight to its
+        offset in ``output_path``. Failed parts are retried by the client's
+        retry policy; if a part still fails, the partial file is removed. If
+        the server does not honour ranges, this falls back to a single
+        streamed download.
+        
+        Args:
+            node_id: VFS node UUID
+            output_path: Path to save the file
+            max_workers: Maximum number of concurrent range requests
+            part_size: Size of each range request in bytes (default: 8 MiB)
+            
+        Returns:
+            The saved file path
+        """
+        endpoint = f'/api/v2/vfs/nodes/{node_id}/download'
+        
+        # The first part doubles as the size probe, saving a HEAD round trip
+        try:
+            first = self.client.get(endpoint, stream=True, headers=_range_headers(0, part_size - 1))
+        except ZetsubouError as e:
+            # Only an empty file cannot satisfy a range starting at byte 0
+            if e.status_code != 416 or self.get_node(node_id, use_cache=False).size_bytes != 0:
+                raise
+            return _write_file(output_path, b'')
+        extent = _content_range(first)
+        if extent is None or extent[0] != 0:
+            # Ranges not supported: the response is the whole file
+            return stream_to_file(first, output_path)
+        total = extent[2]
+        
+        def write_part(response, start: int, end: int):
+            with open(output_path, 'r+b') as part:
+                part.seek(start)
+                stream_to_fileobj(response, part)
+                if part.tell() != end + 1:
+                    raise ZetsubouError(f"Incomplete download of bytes {start}-{end} for node {node_id}")
+        
+        def fetch_part(start: int):
+            end = min(start + part_size, total) - 1
+            response = self.client.get(endpoint, stream=True, headers=_range_headers(start, end))
+            if _content_range(response) != (start, end, total):
+                response.close()
+                raise ZetsubouError(f"Server returned an unexpected range for bytes {start}-{end} of node {node_id}")
+            write_part(response, start, end)
+        
+        try:
+            f = open(output_path, 'wb')
+        except BaseException:
+            first.close()
+            raise
+        try:
+            with f:
+                # Pre-size the file so every part can be written at its offset
+                f.truncate(total)
+            
+            starts = range(extent[1] + 1, total, part_size)
+            with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+                futures = [executor.submit(write_part, first, 0, extent[1])]
+                futures.extend(executor.submit(fetch_part, start) for start in starts)
+                try:
+                    for future in futures:
+                        future.result()
+                except BaseException:
+                    # Don't start parts that are still queued
+                    for future in futures:
+                        future.cancel()
+                    raise
+        except BaseException:
+            # Don't leave a full-size file with holes behind
+            first.close()
+            try:
+                os.remove(output_path)
+            except OSError:
+                pass
+            raise
+        return output_path
+    
     def create_folder(
         self,
         name: str,
@@ -139,7 +547,8 @@ class VFSService:
             data['parent_id'] = parent_id
         
         response = self.client.post('/api/v2/vfs/folders', data=data)
-        result = response.json()
+        result = parse_json(response)
+        invalidate(self)
         return VFSNode.from_dict(result['folder'])
     
     def update_node(
@@ -166,7 +575,8 @@ class VFSService:
             data['parent_id'] = parent_id
         
         response = self.client.patch(f'/api/v2/vfs/nodes/{node_id}', data=data)
-        result = response.json()
+        result = parse_json(response)
+        invalidate(self)
         return VFSNode.from_dict(result['node'])
     
     def delete_node(self, node_id: str) -> bool:
@@ -180,7 +590,9 @@ class VFSService:
             True if deletion was successful
         """
         response = self.client.delete(f'/api/v2/vfs/nodes/{node_id}')
-        data = response.json()
+        data = parse_json(response)
+        invalidate(self)
+        invalidate_peer(self, 'account')
         return data.get('success', False)
     
     def get_folder_contents(self, folder_id: str) -> List[VFSNode]:
@@ -199,35 +611,52 @@ class VFSService:
         self,
         name_pattern: Optional[str] = None,
         mime_type: Optional[str] = None,
-        limit: int = 100
+        limit: int = 100,
+        page_size: int = 200,
+        max_pages: int = SEARCH_MAX_PAGES
     ) -> List[VFSNode]:
         """
         Search for files by name pattern or MIME type.
         
+        The API has no search filters, so file listings are fetched page by
+        page and filtered client-side until ``limit`` matches are found, the
+        listing ends or ``max_pages`` pages have been scanned.
+        
         Args:
             name_pattern: Pattern to match in file names
             mime_type: MIME type to filter by
-            limit: Number of results per page
+            limit: Maximum number of results
+            page_size: Number of nodes requested per page
+            max_pages: Maximum number of pages scanned
             
         Returns:
             List of matching VFSNode objects
         """
-        # Note: This would require additional API endpoints for search
-        # For now, we'll list all files and filter client-side
-        all_nodes = self.list_nodes(limit=limit)
+        params = {'type': 'file', 'limit': page_size, 'offset': 0}
+        pattern = name_pattern.lower() if name_pattern else None
         
         results = []
-        for node in all_nodes:
-            if node.type != 'file':
-                continue
-            
-            if name_pattern and name_pattern.lower() not in node.name.lower():
-                continue
+        for _ in range(max(1, max_pages)):
+            response = self.client.get('/api/v2/vfs/nodes', params=params)
+            page = parse_json(response)['nodes']
             
-            if mime_type and node.mime_type != mime_type:
-                continue
+            for node in VFSNode.from_dicts(page):
+                if node.type != 'file':
+                    continue
+                
+                if pattern and pattern not in node.name.lower():
+                    continue
+                
+                if mime_type and node.mime_type != mime_type:
+                    continue
+                
+                results.append(node)
+                if len(results) == limit:
+                    return results
             
-            results.append(node)
+            if len(page) < page_size:
+                break
+            params['offset'] += len(page)
         
         return results
     
@@ -239,7 +668,7 @@ class VFSService:
             List of shared folder dictionaries
         """
         response = self.client.get('/api/v2/shared-folders')
-        data = response.json()
+        data = parse_json(response)
         return data.get('folders', [])
     
     def get_shared_folder(self, folder_id: str) -> Dict[str, Any]:
@@ -253,7 +682,7 @@ class VFSService:
             Dictionary with folder details and file list
         """
         response = self.client.get(f'/api/v2/shared-folders/{folder_id}')
-        data = response.json()
+        data = parse_json(response)
         return data
     
     def create_shortcut(
@@ -283,7 +712,8 @@ class VFSService:
             f'/api/v2/shared-folders/{folder_id}/shortcut',
             data=data
         )
-        result = response.json()
+        result = parse_json(response)
+        invalidate(self)
         return result.get('shortcut', {})
     
     def delete_workspace(self, workspace_id: str) -> bool:
@@ -297,5 +727,187 @@ class VFSService:
             True if deletion was successful
         """
         response = self.client.delete(f'/api/vfs/workspace/{workspace_id}')
-        data = response.json()
-        return data.get('success', False)
\ No newline at end of file
+        data = parse_json(response)
+        invalidate(self)
+        invalidate_peer(self, 'account')
+        return data.get('success', False)
+
+
+class AsyncVFSService:
+    """
+    Async counterpart of :class:`VFSService` for :class:`~zetsubou.AsyncZetsubouClient`.
+    
+    Covers the hot-path node, upload and download operations, so many of
+    them can run concurrently from one event loop (see :meth:`upload_many`).
+    """
+    
+    def __init__(self, client):
+        self.client = client
+    
+    async def list_nodes(
+        self,
+        parent_id: Optional[str] = None,
+        node_type: Optional[str] = None,
+        limit: int = 100,
+        offset: int = 0
+    ) -> List[VFSNode]:
+        """
+        List VFS nodes (files and folders).
+        
+        Args:
+            parent_id: Filter by parent folder ID
+            node_type: Filter by node type ('file' or 'folder')
+            limit: Number of results per page
+            offset: Pagination offset
+            
+        Returns:
+            List of VFSNode objects
+        """
+        params = {
+            'limit': limit,
+            'offset': offset
+        }
+        if parent_id:
+            params['parent_id'] = parent_id
+        if node_type:
+            params['type'] = node_type
+        
+        response = await self.client.get('/api/v2/vfs/nodes', params=params)
+        data = parse_json(response)
+        return VFSNode.from_dicts(data['nodes'])
+    
+    async def get_node(self, node_id: str) -> VFSNode:
+        """
+        Get details for a specific VFS node.
+        
+        Args:
+            node_id: VFS node UUID
+            
+        Returns:
+            VFSNode object
+        """
+        response = await self.client.get(f'/api/v2/vfs/nodes/{node_id}')
+        data = parse_json(response)
+        return VFSNode.from_dict(data['node'])
+    
+    async def upload_file(
+        self,
+        file: Union[str, os.PathLike, BinaryIO],
+        parent_id: Optional[str] = None,
+        encrypt: bool = False
+    ) -> VFSNode:
+        """
+        Upload a file to VFS.
+        
+        Args:
+            file: File path (str or path-like) or file-like object
+            parent_id: Optional parent folder ID
+            encrypt: Whether to encrypt the file
+            
+        Returns:
+            VFSNode object for the uploaded file
+        """
+        form_data = {'encrypt': str(encrypt).lower()}
+        if parent_id:
+            form_data['parent_id'] = parent_id
+        
+        fh = None
+        if isinstance(file, (str, os.PathLike)):
+            fh = open(file, 'rb')
+            content_type = mimetypes.guess_type(file)[0] or 'application/octet-stream'
+            file_data = {'file': (os.path.basename(file), fh, content_type)}
+        else:
+            file_data = {'file': file}
+        
+        try:
+            response = await self.client.post('/api/v2/vfs/upload', data=form_data, files=file_data)
+        finally:
+            if fh is not None:
+                fh.close()
+        data = parse_json(response)
+        return VFSNode.from_dict(data['node'])
+    
+    async def upload_many(
+        self,
+        files: List[Union[str, os.PathLike, BinaryIO]],
+        parent_id: Optional[str] = None,
+        encrypt: bool = False,
+        max_concurrency: int = 8
+    ) -> List[VFSNode]:
+        """
+        Upload several files concurrently.
+        
+        Args:
+            files: File paths or file-like objects
+            parent_id: Optional parent folder ID
+            encrypt: Whether to encrypt the files
+            max_concurrency: Maximum number of uploads (and open files) at once
+            
+        Returns:
+            VFSNode objects, in the order of ``files``
+        """
+        import asyncio
+        
+        semaphore = asyncio.Semaphore(max(1, max_concurrency))
+        
+        async def upload(file):
+            async with semaphore:
+                return await self.upload_file(file, parent_id=parent_id, encrypt=encrypt)
+        
+        return list(await asyncio.gather(*[upload(file) for file in files]))
+    
+    async def download_file(self, node_id: str, output_path: Optional[str] = None) -> Union[bytes, str]:
+        """
+        Download a file from VFS.
+        
+        The body is read into memory; use :meth:`VFSService.download_file`
+        to stream very large files to disk.
+        
+        Args:
+            node_id: VFS node UUID
+            output_path: Optional path to save the file
+            
+        Returns:
+            File content as bytes if no output_path, otherwise the saved file path
+        """
+        response = await self.client.get(f'/api/v2/vfs/nodes/{node_id}/download')
+        if output_path:
+            import asyncio
+            
+            # Write off the event loop
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(None, _write_file, output_path, response.content)
+        return response.content
+    
+    async def create_folder(self, name: str, parent_id: Optional[str] = None) -> VFSNode:
+        """
+        Create a new folder in VFS.
+        
+        Args:
+            name: Folder name
+            parent_id: Optional parent folder ID
+            
+        Returns:
+            VFSNode object for the created folder
+        """
+        data = {'name': name}
+        if parent_id:
+            data['parent_id'] = parent_id
+        
+        response = await self.client.post('/api/v2/vfs/folders', data=data)
+        result = parse_json(response)
+        return VFSNode.from_dict(result['folder'])
+    
+    async def delete_node(self, node_id: str) -> bool:
+        """
+        Delete a VFS node (soft delete).
+        
+        Args:
+            node_id: VFS node UUID
+            
+        Returns:
+            True if deletion was successful
+        """
+        response = await self.client.delete(f'/api/v2/vfs/nodes/{node_id}')
+        data = parse_json(response)
+        return data.get('success', False)
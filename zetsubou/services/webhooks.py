@@ -4,9 +4,16 @@ Webhooks Service
 Handles webhook management and event subscriptions.
 """
 
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Any, Optional
+from .._errors import is_unsupported
 from ..models import Webhook
 from ..exceptions import ZetsubouError
+from ..utils import parse_json
+from ._cache import cached, invalidate
+
+# Cached reads that webhook writes cannot change
+_REFERENCE_READS = ('get_available_events',)
 
 
 class WebhooksService:
@@ -14,17 +21,24 @@ class WebhooksService:
     
     def __init__(self, client):
         self.client = client
+        # False once the batch creation endpoint has returned 404
+        self._batch_supported = True
     
+    @cached('normal', stale_ttl=60)
     def list(self) -> List[Webhook]:
         """
         List all webhooks for the current user.
         
+        Cached for 30 seconds; pass ``use_cache=False`` to force a fresh fetch.
+        For 60 seconds after that the cached list is still returned
+        immediately while it is revalidated (with its ETag) in the background.
+        
         Returns:
             List of Webhook objects
         """
-        response = self.client.get('/api/v2/webhooks')
-        data = response.json()
-        return [Webhook.from_dict(webhook) for webhook in data['webhooks']]
+        response = self.client.get('/api/v2/webhooks', revalidate=True)
+        data = parse_json(response)
+        return Webhook.from_dicts(data['webhooks'])
     
     def create(
         self,
@@ -51,21 +65,66 @@ class WebhooksService:
             data['secret'] = secret
         
         response = self.client.post('/api/v2/webhooks', data=data)
-        result = response.json()
+        result = parse_json(response)
+        invalidate(self, keep=_REFERENCE_READS)
         return Webhook.from_dict(result['webhook'])
     
+    def create_many(self, specs: List[Dict[str, Any]]) -> List[Webhook]:
+        """
+        Create several webhooks in one request.
+        
+        Falls back to concurrent single creations if the server does not
+        provide the batch endpoint.
+        
+        Args:
+            specs: Webhook definitions, each a dict with ``url``, ``events``
+                and optionally ``secret`` (the arguments of :meth:`create`)
+            
+        Returns:
+            Webhook objects in the order of ``specs``
+        """
+        if not specs:
+            return []
+        
+        if self._batch_supported:
+            try:
+                response = self.client.post('/api/v2/webhooks/batch', data={'webhooks': list(specs)})
+            except ZetsubouError as e:
+                # Without the route, /webhooks/batch may hit /webhooks/{id}
+                # and be answered 405
+                if not is_unsupported(e):
+                    raise
+                self._batch_supported = False
+            else:
+                result = parse_json(response)
+                invalidate(self, keep=_REFERENCE_READS)
+                return Webhook.from_dicts(result['webhooks'])
+        
+        # Build the shared session before the worker threads need it
+        self.client.session
+        with ThreadPoolExecutor(max_workers=min(8, len(specs))) as executor:
+            futures = [
+                executor.submit(self.create, spec['url'], spec['events'], spec.get('secret'))
+                for spec in specs
+            ]
+            return [future.result() for future in futures]
+    
+    @cached('normal')
     def get(self, webhook_id: int) -> Webhook:
         """
         Get details for a specific webhook.
         
+        Cached for 30 seconds; pass ``use_cache=False`` to force a fresh fetch.
+        Once expired, the webhook is revalidated with its ETag.
+        
         Args:
             webhook_id: Webhook ID
             
         Returns:
             Webhook object
         """
-        response = self.client.get(f'/api/v2/webhooks/{webhook_id}')
-        data = response.json()
+        response = self.client.get(f'/api/v2/webhooks/{webhook_id}', revalidate=True)
+        data = parse_json(response)
         return Webhook.from_dict(data['webhook'])
     
     def update(
@@ -100,7 +159,8 @@ class WebhooksService:
             data['enabled'] = enabled
         
         response = self.client.put(f'/api/v2/webhooks/{webhook_id}', data=data)
-        result = response.json()
+        result = parse_json(response)
+        invalidate(self, keep=_REFERENCE_READS)
         return Webhook.from_dict(result['webhook'])
     
     def delete(self, webhook_id: int) -> bool:
@@ -114,7 +174,8 @@ class WebhooksService:
             True if deletion was successful
         """
         response = self.client.delete(f'/api/v2/webhooks/{webhook_id}')
-        data = response.json()
+        data = parse_json(response)
+        invalidate(self, keep=_REFERENCE_READS)
         return data.get('success', False)
     
     def test(self, webhook_id: int) -> bool:
@@ -128,13 +189,17 @@ class WebhooksService:
             True if test was sent successfully
         """
         response = self.client.post(f'/api/v2/webhooks/{webhook_id}/test')
-        data = response.json()
+        data = parse_json(response)
+        invalidate(self, keep=_REFERENCE_READS)
         return data.get('success', False)
     
+    @cached('short')
     def get_stats(self, webhook_id: int, days: int = 7) -> Dict[str, Any]:
         """
         Get delivery statistics for a webhook.
         
+        Cached for 5 seconds; pass ``use_cache=False`` to force a fresh fetch.
+        
         Args:
             webhook_id: Webhook ID
             days: Number of days to look back
@@ -144,17 +209,20 @@ class WebhooksService:
         """
         params = {'days': days}
         response = self.client.get(f'/api/v2/webhooks/{webhook_id}/stats', params=params)
-        return response.json()
+        return parse_json(response)
     
+    @cached('static')
     def get_available_events(self) -> Dict[str, str]:
         """
         Get available webhook event types.
         
+        Cached for 5 minutes; pass ``use_cache=False`` to force a fresh fetch.
+        
         Returns:
             Dictionary mapping event types to descriptions
         """
         response = self.client.get('/api/v2/webhooks/events')
-        data = response.json()
+        data = parse_json(response)
         return data['events']
     
     def create_job_webhook(
@@ -219,6 +287,10 @@ class WebhooksService:
         """
         Create a webhook that subscribes to all available events.
         
+        The event catalogue comes from the :meth:`get_available_events`
+        cache (kept across webhook writes), so this is usually a single
+        request.
+        
         Args:
             url: Webhook URL
             secret: Optional webhook secret
@@ -227,4 +299,111 @@ class WebhooksService:
             Webhook object
         """
         events = list(self.get_available_events().keys())
-        return self.create(url, events, secret)
\ No newline at end of file
+        return self.create(url, events, secret)
+
+
+class AsyncWebhooksService:
+    """Async counterpart of :class:`WebhooksService` for :class:`~zetsubou.AsyncZetsubouClient`."""
+    
+    def __init__(self, client):
+        self.client = client
+    
+    async def list(self) -> List[Webhook]:
+        """
+        List all webhooks for the current user.
+        
+        Returns:
+            List of Webhook objects
+        """
+        response = await self.client.get('/api/v2/webhooks')
+        data = parse_json(response)
+        return Webhook.from_dicts(data['webhooks'])
+    
+    async def get(self, webhook_id: int) -> Webhook:
+        """
+        Get details for a specific webhook.
+        
+        Args:
+            webhook_id: Webhook ID
+            
+        Returns:
+            Webhook object
+        """
+        response = await self.client.get(f'/api/v2/webhooks/{webhook_id}')
+        data = parse_json(response)
+        return Webhook.from_dict(data['webhook'])
+    
+    async def create(
+        self,
+        url: str,
+        events: List[str],
+        secret: Optional[str] = None
+    ) -> Webhook:
+        """
+        Create a new webhook.
+        
+        Args:
+            url: Webhook URL
+            events: List of event types to subscribe to
+            secret: Optional webhook secret for signature verification
+            
+        Returns:
+            Webhook object
+        """
+        data = {
+            'url': url,
+            'events': events
+        }
+        if secret:
+            data['secret'] = secret
+        
+        response = await self.client.post('/api/v2/webhooks', data=data)
+        result = parse_json(response)
+        return Webhook.from_dict(result['webhook'])
+    
+    async def create_many(self, specs: List[Dict[str, Any]], max_concurrency: int = 8) -> List[Webhook]:
+        """
+        Create several webhooks concurrently.
+        
+        Args:
+            specs: Webhook definitions, each a dict with ``url``, ``events``
+                and optionally ``secret`` (the arguments of :meth:`create`)
+            max_concurrency: Maximum number of requests in flight at once
+            
+        Returns:
+            Webhook objects in the order of ``specs``
+        """
+        import asyncio
+        
+        semaphore = asyncio.Semaphore(max(1, max_concurrency))
+        
+        async def create(spec):
+            async with semaphore:
+                return await self.create(spec['url'], spec['events'], spec.get('secret'))
+        
+        return list(await asyncio.gather(*[create(spec) for spec in specs]))
+    
+    async def delete(self, webhook_id: int) -> bool:
+        """
+        Delete a webhook.
+        
+        Args:
+            webhook_id: Webhook ID
+            
+        Returns:
+            True if deletion was successful
+        """
+        response = await self.client.delete(f'/api/v2/webhooks/{webhook_id}')
+        data = parse_json(response)
+        return data.get('success', False)
+    
+    async def get_available_events(self) -> Dict[str, str]:
+        """
+        Get available webhook event types.
+        
+        Returns:
+            Dictionary mapping event types to descriptions
+        """
+        response = await self.client.get('/api/v2/webhooks/events')
+        data = parse_json(response)
+        return data['events']
@@ -0,0 +1,88 @@
+"""
+Zetsubou.life SDK Utilities
+
+Internal helpers shared by the client and service modules.
+"""
+
+import json
+import shutil
+from typing import Any, BinaryIO, Callable, Optional
+
+# Buffer size for copying streamed response bodies to disk
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+
+try:
+    import orjson as _orjson
+except ImportError:  # pragma: no cover - optional "fast" extra
+    _orjson = None
+
+
+def _dumps_json_stdlib(obj: Any, default: Optional[Callable[[Any], Any]] = None) -> bytes:
+    """Encode ``obj`` as UTF-8 JSON; ``default`` converts unsupported values."""
+    # Same encoding requests applies to json= bodies
+    return json.dumps(obj, allow_nan=False, default=default).encode('utf-8')
+
+
+if _orjson is not None:
+    loads_json = _orjson.loads
+    
+    # Non-str dict keys are stringified like json.dumps does, and numpy
+    # arrays serialize natively instead of raising TypeError. Naive
+    # datetimes are sent as-is, without a timezone being assumed.
+    _ORJSON_DUMPS_OPTIONS = _orjson.OPT_SERIALIZE_NUMPY | _orjson.OPT_NON_STR_KEYS
+    
+    def _dumps_json_orjson(obj: Any, default: Optional[Callable[[Any], Any]] = None) -> bytes:
+        """Encode ``obj`` as UTF-8 JSON; ``default`` converts unsupported values."""
+        return _orjson.dumps(obj, default=default, option=_ORJSON_DUMPS_OPTIONS)
+    
+    dumps_json = _dumps_json_orjson
+else:
+    # json.loads accepts bytes directly and detects the encoding itself
+    loads_json = json.loads
+    dumps_json = _dumps_json_stdlib
+
+
+def parse_json(response) -> Any:
+    """
+    Decode a JSON response body.
+    
+    Parses the raw ``response.content`` bytes, skipping the bytes-to-str
+    decode that ``response.json()`` performs first. Uses ``orjson`` when the
+    ``fast`` extra is installed.
+    """
+    return loads_json(response.content)
+
+
+def stream_to_fileobj(response, fileobj: BinaryIO, chunk_size: int = DOWNLOAD_CHUNK_SIZE) -> None:
+    """
+    Copy a streamed (``stream=True``) response body into a binary file object.
+    
+    Copies the underlying urllib3 stream in ``chunk_size`` blocks, so memory
+    use stays bounded regardless of body size. Content-Encoding (gzip) is
+    decoded on the fly. The response is closed afterwards.
+    """
+    raw = response.raw
+    raw.decode_content = True
+    try:
+        shutil.copyfileobj(raw, fileobj, chunk_size)
+    finally:
+        response.close()
+
+
+def stream_to_file(response, output_path: str, chunk_size: int = DOWNLOAD_CHUNK_SIZE) -> str:
+    """
+    Write a streamed (``stream=True``) response body to ``output_path``.
+    
+    See :func:`stream_to_fileobj`.
+    
+    Returns:
+        The output path
+    """
+    try:
+        f = open(output_path, 'wb')
+    except BaseException:
+        response.close()
+        raise
+    with f:
+        stream_to_fileobj(response, f, chunk_size)
+    return output_path